@@ -1,12 +1,47 @@
 import os
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Final, Callable, Any
 
-@dataclass
+# Shared, interned defaults referenced by every config instance
+DEFAULT_DRIVER: Final[str] = sys.intern("ODBC Driver 18 for SQL Server")
+_YES: Final[str] = sys.intern("yes")
+_NO: Final[str] = sys.intern("no")
+
+# Accepted values for the yes/no connection flags
+_YN: frozenset[str] = frozenset((_YES, _NO))
+
+
+def _not_blank(value: str) -> bool:
+    """Return True if value contains something other than whitespace."""
+    return bool(value and value.strip())
+
+
+# (field name, predicate that must hold, message formatted with the offending
+# value); shared by __post_init__ and validate() so both report the same issues
+_VALIDATORS: tuple[tuple[str, Callable[[Any], bool], str], ...] = (
+    ("host", _not_blank, "Host cannot be empty"),
+    ("database", _not_blank, "Database cannot be empty"),
+    ("user", _not_blank, "User cannot be empty"),
+    ("password", _not_blank, "Password cannot be empty"),
+    ("port", lambda port: 0 < port <= 65535, "Invalid port number: {}"),
+    ("encrypt", _YN.__contains__, "Encrypt must be 'yes' or 'no'"),
+    ("trust_server_certificate", _YN.__contains__, "TrustServerCertificate must be 'yes' or 'no'"),
+    ("mars", _YN.__contains__, "MARS_Connection must be 'yes' or 'no'"),
+    ("arraysize", lambda size: size > 0, "Invalid cursor arraysize: {}"),
+    ("pool_max_size", lambda size: size >= 0, "Invalid connection pool size: {}"),
+    ("packet_size", lambda size: size == 0 or 512 <= size <= 32767, "Invalid network packet size: {}"),
+)
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class SQLServerConfig:
     """
     Configuration for SQL Server database connection using pyodbc.
     
+    Instances are immutable and must be built with keyword arguments; derive a
+    modified copy with ``dataclasses.replace(config, encrypt="yes")`` instead of
+    assigning fields.
+    
     Attributes:
         host: SQL Server hostname or IP address
         database: Database name to connect to
@@ -17,6 +52,11 @@ class SQLServerConfig:
         encrypt: Enable encryption (yes/no, default: yes)
         trust_server_certificate: Trust server certificate without validation (yes/no, default: yes for dev/test)
         mars: Enable Multiple Active Result Sets (yes/no, default: no)
+        arraysize: Rows per fetchmany() call on cursors handed out by the connection (default: 1000)
+        pool_max_size: Idle connections kept per connection string for reuse; 0 disables pooling
+            (default: 0). Pooled sessions are not reset, so only enable it when callers leave
+            no session state behind (USE, SET options, #temp tables, open cursors)
+        packet_size: TDS network packet size in bytes, 512-32767; 0 keeps the driver default (default: 16383)
         extra: Additional connection string parameters as key-value pairs
     """
     host: str
@@ -24,31 +64,31 @@ class SQLServerConfig:
     user: str
     password: str
     port: int = 1433
-    driver: str = "ODBC Driver 18 for SQL Server"
-    encrypt: str = "no"  # Changed default to match sqlcmd behavior for local connections
-    trust_server_certificate: str = "yes"  # Required for local SQL Server 2022
-    mars: str = "no"
+    driver: str = DEFAULT_DRIVER
+    encrypt: str = _NO  # Changed default to match sqlcmd behavior for local connections
+    trust_server_certificate: str = _YES  # Required for local SQL Server 2022
+    mars: str = _NO
+    arraysize: int = 1000  # Rows per fetch round-trip instead of pyodbc's default of 1
+    pool_max_size: int = 0  # Opt-in: released sessions keep their state
+    packet_size: int = 16383  # Largest size that also works with encrypted connections
     auto_apply_openssl_patch: bool = True  # Automatically apply OpenSSL patch on macOS TLS errors
     extra: Optional[Dict[str, str]] = None
     
     def __post_init__(self) -> None:
-        """Validate configuration parameters."""
-        if not self.host:
-            raise ValueError("Host cannot be empty")
-        if not self.database:
-            raise ValueError("Database cannot be empty")
-        if not self.user:
-            raise ValueError("User cannot be empty")
-        if not self.password:
-            raise ValueError("Password cannot be empty")
-        if self.port <= 0 or self.port > 65535:
-            raise ValueError(f"Invalid port number: {self.port}")
-        if self.encrypt not in ["yes", "no"]:
-            raise ValueError("Encrypt must be 'yes' or 'no'")
-        if self.trust_server_certificate not in ["yes", "no"]:
-            raise ValueError("TrustServerCertificate must be 'yes' or 'no'")
-        if self.mars not in ["yes", "no"]:
-            raise ValueError("MARS_Connection must be 'yes' or 'no'")
+        """
+        Canonicalize the yes/no flags to lowercase, then validate configuration parameters.
+        
+        Raises:
+            ValueError: Listing every failed check, separated by "; "
+        """
+        # Stored lowercased and interned once so later comparisons need no per-call .lower()
+        object.__setattr__(self, 'encrypt', sys.intern(self.encrypt.lower()))
+        object.__setattr__(self, 'trust_server_certificate', sys.intern(self.trust_server_certificate.lower()))
+        object.__setattr__(self, 'mars', sys.intern(self.mars.lower()))
+        
+        issues = self.validate()
+        if issues:
+            raise ValueError("; ".join(issues))
     
     @classmethod
     def from_environment(cls) -> 'SQLServerConfig':
@@ -64,11 +104,14 @@ class SQLServerConfig:
         Raises:
             ValueError: If required environment variables are missing
         """
+        # Bind the lookup once; every os.getenv call re-enters os.environ
+        get = os.environ.get
+        
         # Required variables
-        host = os.getenv('SQLSERVER_HOST')
-        database = os.getenv('SQLSERVER_DATABASE') 
-        user = os.getenv('SQLSERVER_USER')
-        password = os.getenv('SQLSERVER_PASSWORD')
+        host = get('SQLSERVER_HOST')
+        database = get('SQLSERVER_DATABASE') 
+        user = get('SQLSERVER_USER')
+        password = get('SQLSERVER_PASSWORD')
         
         # Check for required variables
         missing_vars = []
@@ -85,13 +128,15 @@ class SQLServerConfig:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
         
         # Optional variables with defaults
-        port = int(os.getenv('SQLSERVER_PORT', '1433'))
-        driver = os.getenv('SQLSERVER_DRIVER', 'ODBC Driver 18 for SQL Server')
-        encrypt = os.getenv('SQLSERVER_ENCRYPT', 'no')  # Match sqlcmd default
-        trust_cert = os.getenv('SQLSERVER_TRUST_CERT', 'yes')  # Required for local connections
+        port = int(get('SQLSERVER_PORT', '1433'))
+        driver = get('SQLSERVER_DRIVER', DEFAULT_DRIVER)
+        encrypt = get('SQLSERVER_ENCRYPT', _NO)  # Match sqlcmd default
+        trust_cert = get('SQLSERVER_TRUST_CERT', _YES)  # Required for local connections
+        arraysize = int(get('SQLSERVER_ARRAYSIZE', '1000'))
+        packet_size = int(get('SQLSERVER_PACKET_SIZE', '16383'))
         
         # OpenSSL patch configuration
-        auto_patch = os.getenv('SQLSERVER_AUTO_OPENSSL_PATCH', 'true').lower() == 'true'
+        auto_patch = get('SQLSERVER_AUTO_OPENSSL_PATCH', 'true').lower() == 'true'
         
         return cls(
             host=host,
@@ -102,6 +147,8 @@ class SQLServerConfig:
             driver=driver,
             encrypt=encrypt,
             trust_server_certificate=trust_cert,
+            arraysize=arraysize,
+            packet_size=packet_size,
             auto_apply_openssl_patch=auto_patch
         )
     
@@ -113,26 +160,9 @@ class SQLServerConfig:
             List of validation error messages (empty if valid)
         """
         issues = []
-        
-        if not self.host.strip():
-            issues.append("Host cannot be empty")
-        if not self.database.strip():
-            issues.append("Database name cannot be empty")
-        if not self.user.strip():
-            issues.append("Username cannot be empty")
-        if not self.password.strip():
-            issues.append("Password cannot be empty")
-        
-        if self.port <= 0 or self.port > 65535:
-            issues.append(f"Invalid port number: {self.port}")
-        
-        if self.encrypt.lower() not in ["yes", "no"]:
-            issues.append("Encrypt must be 'yes' or 'no'")
-        
-        if self.trust_server_certificate.lower() not in ["yes", "no"]:
-            issues.append("TrustServerCertificate must be 'yes' or 'no'")
-        
-        if self.mars.lower() not in ["yes", "no"]:
-            issues.append("MARS_Connection must be 'yes' or 'no'")
+        for field_name, is_valid, message in _VALIDATORS:
+            value = getattr(self, field_name)
+            if not is_valid(value):
+                issues.append(message.format(value))
         
         return issues
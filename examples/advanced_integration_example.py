@@ -25,7 +25,7 @@ from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # Import the mysql-parquet-lib components
 from src.database.mysql_connection import MySQLConnection
@@ -66,8 +66,8 @@ def validate_database_connection(config: DatabaseConfig) -> bool:
         connection = mysql_connection.connect()
         
         # Test with a simple query
-        query_executor: QueryExecutor = QueryExecutor(connection)
-        test_results: List[Tuple[Any, ...]] = query_executor.execute_query("SELECT 1")
+        with QueryExecutor(connection) as query_executor:
+            test_results: List[Tuple[Any, ...]] = query_executor.execute_query("SELECT 1")
         
         mysql_connection.close()
         return len(test_results) == 1
@@ -142,12 +142,13 @@ def main() -> None:
     
     # Step 4: Main processing
     mysql_connection: Optional[MySQLConnection] = None
+    query_executor: Optional[QueryExecutor] = None
     
     try:
         mysql_connection = MySQLConnection(config)
         connection = mysql_connection.connect()
         
-        query_executor: QueryExecutor = QueryExecutor(connection)
+        query_executor = QueryExecutor(connection)
         parquet_writer: ParquetWriter = ParquetWriter()
         
         print("\n🔍 Step 4: Executing advanced queries and exporting to Parquet...")
@@ -321,7 +322,9 @@ def main() -> None:
         traceback.print_exc()
         
     finally:
-        # Cleanup
+        # Cleanup: the executor's cached cursors first, then the connection
+        if query_executor:
+            query_executor.close()
         if mysql_connection:
             print("\n🔒 Closing database connection...")
             mysql_connection.close()
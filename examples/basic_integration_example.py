@@ -23,7 +23,7 @@ from typing import List, Tuple, Any, Optional
 from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 # Import the mysql-parquet-lib components
 from src.database.mysql_connection import MySQLConnection
@@ -74,6 +74,7 @@ def main() -> None:
     # Step 3: Establish database connection
     print("\n🔌 Step 3: Connecting to MySQL database...")
     mysql_connection: Optional[MySQLConnection] = None
+    query_executor: Optional[QueryExecutor] = None
     
     try:
         mysql_connection = MySQLConnection(config)
@@ -82,7 +83,7 @@ def main() -> None:
         
         # Step 4: Initialize query executor
         print("\n⚡ Step 4: Initializing query executor...")
-        query_executor: QueryExecutor = QueryExecutor(connection)
+        query_executor = QueryExecutor(connection)
         print("✓ Query executor ready")
         
         # Step 5: Initialize parquet writer
@@ -153,7 +154,9 @@ def main() -> None:
         return
         
     finally:
-        # Step 7: Clean up connections
+        # Step 7: Clean up the executor's cached cursors, then the connection
+        if query_executor:
+            query_executor.close()
         if mysql_connection:
             print("\n🔒 Step 7: Closing database connection...")
             mysql_connection.close()
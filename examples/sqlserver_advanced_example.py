@@ -19,290 +19,341 @@ Usage:
     python examples/sqlserver_advanced_example.py
 """
 
+import io
 import os
 import sys
+import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Tuple, Any, Final, TYPE_CHECKING
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from config.sqlserver_config import SQLServerConfig
-from src.database.sqlserver_connection import SQLServerConnection
-from src.query.query_executor import QueryExecutor
-from src.export.parquet_writer import ParquetWriter
 
+if TYPE_CHECKING:
+    import pyodbc
 
-def create_timestamped_directory(base_dir: str = "parquetFiles/sqlserver") -> Path:
+# Status output is collected here and written in a few large chunks
+_log_buffer: io.StringIO = io.StringIO()
+
+
+def log(message: str = "") -> None:
+    """Queue a status line for the next flush_log() call."""
+    _log_buffer.write(message)
+    _log_buffer.write("\n")
+
+
+def flush_log() -> None:
+    """Write all queued status lines to stdout in a single call."""
+    sys.stdout.write(_log_buffer.getvalue())
+    sys.stdout.flush()
+    _log_buffer.seek(0)
+    _log_buffer.truncate()
+
+
+# Directories already created by this process; repeat calls skip the mkdir syscalls
+_created_dirs: set[str] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create path (and parents) once per process and return it."""
+    key: str = str(path)
+    if key not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(key)
+    return path
+
+
+# SQL text lives at module level so it is built once at import time
+_STATS_QUERY: Final[str] = """
+    SELECT 
+        d.name as database_name,
+        d.state_desc,
+        d.recovery_model_desc,
+        CAST(SUM(mf.size) * 8.0 / 1024 AS DECIMAL(10,2)) as total_size_mb,
+        d.create_date,
+        d.compatibility_level
+    FROM sys.databases d
+    LEFT JOIN sys.master_files mf ON d.database_id = mf.database_id
+    WHERE d.database_id > 4  -- Skip system databases
+    GROUP BY d.name, d.state_desc, d.recovery_model_desc, d.create_date, d.compatibility_level
+    ORDER BY total_size_mb DESC
+"""
+
+_SCHEMA_QUERY: Final[str] = """
+    WITH object_stats AS (
+        SELECT 
+            s.name as schema_name,
+            t.name as table_name,
+            t.type_desc as object_type,
+            p.rows as row_count,
+            CAST(SUM(a.total_pages) * 8.0 / 1024 AS DECIMAL(10,2)) as total_size_mb,
+            t.create_date
+        FROM sys.tables t
+        INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
+        LEFT JOIN sys.partitions p ON t.object_id = p.object_id AND p.index_id IN (0, 1)
+        LEFT JOIN sys.allocation_units a ON p.partition_id = a.container_id
+        GROUP BY s.name, t.name, t.type_desc, p.rows, t.create_date
+    )
+    SELECT 
+        schema_name,
+        table_name,
+        object_type,
+        row_count,
+        total_size_mb,
+        create_date,
+        ROW_NUMBER() OVER (ORDER BY total_size_mb DESC) as size_rank,
+        RANK() OVER (PARTITION BY schema_name ORDER BY row_count DESC) as row_rank_in_schema
+    FROM object_stats
+    WHERE total_size_mb > 0
+    ORDER BY total_size_mb DESC
+"""
+
+_INDEX_QUERY: Final[str] = """
+    SELECT TOP 50
+        OBJECT_SCHEMA_NAME(i.object_id) as schema_name,
+        OBJECT_NAME(i.object_id) as table_name,
+        i.name as index_name,
+        i.type_desc as index_type,
+        i.is_unique,
+        i.is_primary_key,
+        CAST(SUM(s.used_page_count) * 8.0 / 1024 AS DECIMAL(10,2)) as index_size_mb,
+        us.user_seeks,
+        us.user_scans,
+        us.user_lookups,
+        us.user_updates,
+        us.last_user_seek,
+        us.last_user_scan
+    FROM sys.indexes i
+    INNER JOIN sys.dm_db_partition_stats s ON i.object_id = s.object_id AND i.index_id = s.index_id
+    LEFT JOIN sys.dm_db_index_usage_stats us ON i.object_id = us.object_id AND i.index_id = us.index_id
+    WHERE OBJECTPROPERTY(i.object_id, 'IsUserTable') = 1
+    GROUP BY 
+        i.object_id, i.name, i.type_desc, i.is_unique, i.is_primary_key,
+        us.user_seeks, us.user_scans, us.user_lookups, us.user_updates,
+        us.last_user_seek, us.last_user_scan
+    ORDER BY index_size_mb DESC
+"""
+
+_SESSIONS_QUERY: Final[str] = """
+    SELECT 
+        s.session_id,
+        s.login_name,
+        s.host_name,
+        s.program_name,
+        s.status,
+        s.cpu_time,
+        s.memory_usage,
+        s.total_elapsed_time,
+        s.login_time,
+        s.last_request_start_time,
+        c.num_reads,
+        c.num_writes,
+        DB_NAME(s.database_id) as database_name
+    FROM sys.dm_exec_sessions s
+    LEFT JOIN sys.dm_exec_connections c ON s.session_id = c.session_id
+    WHERE s.is_user_process = 1
+    ORDER BY s.total_elapsed_time DESC
+"""
+
+
+# Working directory resolved once at startup (a single getcwd call)
+_CWD: Path = Path.cwd()
+
+
+def create_timestamped_directory(base_dir: str = "parquetFiles/sqlserver", cwd: Path = _CWD) -> Path:
     """
     Create a timestamped directory for organized exports.
     
     Args:
         base_dir: Base directory path
+        cwd: Directory that base_dir is resolved against (default: startup working directory)
         
     Returns:
         Path object for the created directory
     """
-    timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
-    export_dir: Path = Path(os.getcwd()) / base_dir / f"export_{timestamp}"
-    export_dir.mkdir(parents=True, exist_ok=True)
-    return export_dir
+    timestamp: str = time.strftime("%Y%m%d_%H%M%S")
+    return ensure_dir(cwd / base_dir / f"export_{timestamp}")
 
 
-def validate_connection(sql_conn: SQLServerConnection) -> bool:
+def validate_connection(connection: "pyodbc.Connection") -> bool:
     """
-    Validate SQL Server connection before processing.
+    Validate an open SQL Server connection before processing.
+    
+    Reads the server version from the metadata the driver already received
+    at login, so no extra query round-trip is made.
     
     Args:
-        sql_conn: SQLServerConnection instance
+        connection: Open pyodbc connection
         
     Returns:
         True if connection is valid, False otherwise
     """
+    import pyodbc
+    
     try:
-        connection = sql_conn.connect()
-        cursor = connection.cursor()
-        cursor.execute("SELECT @@VERSION as version")
-        result = cursor.fetchone()
-        cursor.close()
+        version: str = connection.getinfo(pyodbc.SQL_DBMS_VER)
         
-        if result:
-            print(f"✓ SQL Server version: {result[0][:80]}...")
+        if version:
+            log(f"✓ SQL Server version: {version[:80]}")
             return True
         return False
     except Exception as e:
-        print(f"✗ Connection validation failed: {e}")
+        log(f"✗ Connection validation failed: {e}")
         return False
 
 
 def main() -> None:
     """Main execution function for SQL Server advanced integration example."""
+    # Deferred so importing this module does not load pyodbc and pyarrow
+    import pyarrow as pa
+    from src.database.sqlserver_connection import SQLServerConnection
+    from src.query.query_executor import QueryExecutor
+    from src.export.parquet_writer import ParquetWriter
     
-    print("=" * 80)
-    print("SQL Server to Parquet - Advanced Integration Example")
-    print("=" * 80)
-    print()
+    log("=" * 80)
+    log("SQL Server to Parquet - Advanced Integration Example")
+    log("=" * 80)
+    log()
     
     # Configure SQL Server connection
+    # Snapshot the connection variables once instead of one os.getenv per field
+    environ = os.environ
+    env: Dict[str, str] = {
+        key: environ[key]
+        for key in (
+            "MSSQL_HOST",
+            "MSSQL_PORT",
+            "MSSQL_DATABASE",
+            "MSSQL_USER",
+            "MSSQL_PASSWORD",
+            "MSSQL_ENCRYPT",
+            "MSSQL_TRUST_CERT",
+        )
+        if key in environ
+    }
     config = SQLServerConfig(
-        host=os.getenv("MSSQL_HOST", "localhost"),
-        port=int(os.getenv("MSSQL_PORT", "1433")),
-        database=os.getenv("MSSQL_DATABASE", "tempdb"),
-        user=os.getenv("MSSQL_USER", "sa"),
-        password=os.getenv("MSSQL_PASSWORD", "YourStrong!Passw0rd"),
-        encrypt=os.getenv("MSSQL_ENCRYPT", "yes"),
-        trust_server_certificate=os.getenv("MSSQL_TRUST_CERT", "yes"),
+        host=env.get("MSSQL_HOST", "localhost"),
+        port=int(env.get("MSSQL_PORT", "1433")),
+        database=env.get("MSSQL_DATABASE", "tempdb"),
+        user=env.get("MSSQL_USER", "sa"),
+        password=env.get("MSSQL_PASSWORD", "YourStrong!Passw0rd"),
+        encrypt=env.get("MSSQL_ENCRYPT", "yes"),
+        trust_server_certificate=env.get("MSSQL_TRUST_CERT", "yes"),
     )
     
-    print(f"Target Server: {config.host}:{config.port}")
-    print(f"Database: {config.database}")
-    print()
+    log(f"Target Server: {config.host}:{config.port}")
+    log(f"Database: {config.database}")
+    log()
     
     # Create connection
     sql_conn = SQLServerConnection(config)
+    query_executor = None
     
     try:
+        # The driver may print OpenSSL patch notices while connecting
+        flush_log()
+        connection = sql_conn.connect()
+        
         # Validate connection
-        print("Validating connection...")
-        if not validate_connection(sql_conn):
+        log("Validating connection...")
+        if not validate_connection(connection):
             raise Exception("Connection validation failed")
-        print()
+        log()
         
-        connection = sql_conn.connect()
         query_executor = QueryExecutor(connection)
         parquet_writer = ParquetWriter()
         
         # Create timestamped export directory
+        export_start: datetime = datetime.now()
         export_dir = create_timestamped_directory()
-        print(f"Export directory: {export_dir}")
-        print()
+        log(f"Export directory: {export_dir}")
+        log()
         
-        # Track export results
-        exports: List[Dict[str, Any]] = []
+        # Metadata queries, sent to the server as one batch and kept columnar
+        log("Executing metadata queries in a single round-trip...")
+        stats_result, schema_result, index_result, sessions_result = query_executor.execute_multi_to_arrow(
+            [_STATS_QUERY, _SCHEMA_QUERY, _INDEX_QUERY, _SESSIONS_QUERY]
+        )
+        log()
+        flush_log()
         
-        # Example 1: Database statistics with aggregations
-        print("-" * 80)
-        print("Example 1: Database Statistics Analysis")
-        print("-" * 80)
+        # Encode the result sets concurrently; pyarrow releases the GIL while writing
+        jobs: List[Tuple[str, str, pa.Table]] = [
+            ("Database Statistics", "database_statistics.parquet", stats_result),
+            ("Schema Analysis", "schema_analysis.parquet", schema_result),
+            ("Index Analysis", "index_analysis.parquet", index_result),
+            ("Active Sessions", "active_sessions.parquet", sessions_result),
+        ]
         
-        stats_query = """
-        SELECT 
-            d.name as database_name,
-            d.state_desc,
-            d.recovery_model_desc,
-            CAST(SUM(mf.size) * 8.0 / 1024 AS DECIMAL(10,2)) as total_size_mb,
-            d.create_date,
-            d.compatibility_level
-        FROM sys.databases d
-        LEFT JOIN sys.master_files mf ON d.database_id = mf.database_id
-        WHERE d.database_id > 4  -- Skip system databases
-        GROUP BY d.name, d.state_desc, d.recovery_model_desc, d.create_date, d.compatibility_level
-        ORDER BY total_size_mb DESC
-        """
+        def write_export(job: Tuple[str, str, pa.Table]) -> Dict[str, Any]:
+            query_name, file_name, table = job
+            parquet_writer.write_table_to_parquet(table, str(export_dir / file_name))
+            return {
+                "query_name": query_name,
+                "file_name": file_name,
+                "row_count": table.num_rows
+            }
         
-        print("Executing database statistics query...")
-        stats_result = query_executor.execute_query(stats_query)
+        log("Writing Parquet files in parallel...")
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            exports = list(pool.map(write_export, [job for job in jobs if job[2].num_rows]))
+        log()
         
-        if stats_result:
-            stats_file = export_dir / "database_statistics.parquet"
-            parquet_writer.write_to_parquet(stats_result, str(stats_file))
-            print(f"✓ Exported {len(stats_result)} databases to: {stats_file.name}")
-            exports.append({
-                "query_name": "Database Statistics",
-                "file_name": stats_file.name,
-                "row_count": len(stats_result)
-            })
-        print()
+        # Example 1: Database statistics with aggregations
+        log("-" * 80)
+        log("Example 1: Database Statistics Analysis")
+        log("-" * 80)
+        if stats_result.num_rows:
+            log(f"✓ Exported {stats_result.num_rows} databases to: database_statistics.parquet")
+        log()
         
         # Example 2: Schema analysis with window functions
-        print("-" * 80)
-        print("Example 2: Schema Object Analysis with Rankings")
-        print("-" * 80)
-        
-        schema_query = """
-        WITH object_stats AS (
-            SELECT 
-                s.name as schema_name,
-                t.name as table_name,
-                t.type_desc as object_type,
-                p.rows as row_count,
-                CAST(SUM(a.total_pages) * 8.0 / 1024 AS DECIMAL(10,2)) as total_size_mb,
-                t.create_date
-            FROM sys.tables t
-            INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
-            LEFT JOIN sys.partitions p ON t.object_id = p.object_id AND p.index_id IN (0, 1)
-            LEFT JOIN sys.allocation_units a ON p.partition_id = a.container_id
-            GROUP BY s.name, t.name, t.type_desc, p.rows, t.create_date
-        )
-        SELECT 
-            schema_name,
-            table_name,
-            object_type,
-            row_count,
-            total_size_mb,
-            create_date,
-            ROW_NUMBER() OVER (ORDER BY total_size_mb DESC) as size_rank,
-            RANK() OVER (PARTITION BY schema_name ORDER BY row_count DESC) as row_rank_in_schema
-        FROM object_stats
-        WHERE total_size_mb > 0
-        ORDER BY total_size_mb DESC
-        """
-        
-        print("Executing schema analysis query...")
-        schema_result = query_executor.execute_query(schema_query)
-        
-        if schema_result:
-            schema_file = export_dir / "schema_analysis.parquet"
-            parquet_writer.write_to_parquet(schema_result, str(schema_file))
-            print(f"✓ Exported {len(schema_result)} objects to: {schema_file.name}")
+        log("-" * 80)
+        log("Example 2: Schema Object Analysis with Rankings")
+        log("-" * 80)
+        if schema_result.num_rows:
+            log(f"✓ Exported {schema_result.num_rows} objects to: schema_analysis.parquet")
             
-            # Display top 5 largest objects
-            print("\nTop 5 largest objects:")
-            for i, obj in enumerate(schema_result[:5], 1):
-                print(f"  {i}. {obj.get('schema_name')}.{obj.get('table_name')} - "
-                      f"{obj.get('total_size_mb')} MB ({obj.get('row_count')} rows)")
-            
-            exports.append({
-                "query_name": "Schema Analysis",
-                "file_name": schema_file.name,
-                "row_count": len(schema_result)
-            })
-        print()
+            # Display top 5 largest objects, read column-wise from the table
+            log("\nTop 5 largest objects:")
+            top = schema_result.slice(0, 5)
+            top_objects: List[Tuple[Any, ...]] = list(zip(
+                *(top.column(name).to_pylist()
+                  for name in ("schema_name", "table_name", "total_size_mb", "row_count"))
+            ))
+            for i, (schema_name, table_name, size_mb, row_count) in enumerate(top_objects, 1):
+                log(f"  {i}. {schema_name}.{table_name} - {size_mb} MB ({row_count} rows)")
+        log()
         
         # Example 3: Index analysis
-        print("-" * 80)
-        print("Example 3: Index Usage and Performance Analysis")
-        print("-" * 80)
-        
-        index_query = """
-        SELECT TOP 50
-            OBJECT_SCHEMA_NAME(i.object_id) as schema_name,
-            OBJECT_NAME(i.object_id) as table_name,
-            i.name as index_name,
-            i.type_desc as index_type,
-            i.is_unique,
-            i.is_primary_key,
-            CAST(SUM(s.used_page_count) * 8.0 / 1024 AS DECIMAL(10,2)) as index_size_mb,
-            us.user_seeks,
-            us.user_scans,
-            us.user_lookups,
-            us.user_updates,
-            us.last_user_seek,
-            us.last_user_scan
-        FROM sys.indexes i
-        INNER JOIN sys.dm_db_partition_stats s ON i.object_id = s.object_id AND i.index_id = s.index_id
-        LEFT JOIN sys.dm_db_index_usage_stats us ON i.object_id = us.object_id AND i.index_id = us.index_id
-        WHERE OBJECTPROPERTY(i.object_id, 'IsUserTable') = 1
-        GROUP BY 
-            i.object_id, i.name, i.type_desc, i.is_unique, i.is_primary_key,
-            us.user_seeks, us.user_scans, us.user_lookups, us.user_updates,
-            us.last_user_seek, us.last_user_scan
-        ORDER BY index_size_mb DESC
-        """
-        
-        print("Executing index analysis query...")
-        index_result = query_executor.execute_query(index_query)
-        
-        if index_result:
-            index_file = export_dir / "index_analysis.parquet"
-            parquet_writer.write_to_parquet(index_result, str(index_file))
-            print(f"✓ Exported {len(index_result)} indexes to: {index_file.name}")
-            exports.append({
-                "query_name": "Index Analysis",
-                "file_name": index_file.name,
-                "row_count": len(index_result)
-            })
-        print()
+        log("-" * 80)
+        log("Example 3: Index Usage and Performance Analysis")
+        log("-" * 80)
+        if index_result.num_rows:
+            log(f"✓ Exported {index_result.num_rows} indexes to: index_analysis.parquet")
+        log()
         
         # Example 4: Active sessions and connections
-        print("-" * 80)
-        print("Example 4: Active Sessions Analysis")
-        print("-" * 80)
-        
-        sessions_query = """
-        SELECT 
-            s.session_id,
-            s.login_name,
-            s.host_name,
-            s.program_name,
-            s.status,
-            s.cpu_time,
-            s.memory_usage,
-            s.total_elapsed_time,
-            s.login_time,
-            s.last_request_start_time,
-            c.num_reads,
-            c.num_writes,
-            DB_NAME(s.database_id) as database_name
-        FROM sys.dm_exec_sessions s
-        LEFT JOIN sys.dm_exec_connections c ON s.session_id = c.session_id
-        WHERE s.is_user_process = 1
-        ORDER BY s.total_elapsed_time DESC
-        """
-        
-        print("Executing active sessions query...")
-        sessions_result = query_executor.execute_query(sessions_query)
-        
-        if sessions_result:
-            sessions_file = export_dir / "active_sessions.parquet"
-            parquet_writer.write_to_parquet(sessions_result, str(sessions_file))
-            print(f"✓ Exported {len(sessions_result)} sessions to: {sessions_file.name}")
-            print(f"  Active user sessions: {len(sessions_result)}")
-            exports.append({
-                "query_name": "Active Sessions",
-                "file_name": sessions_file.name,
-                "row_count": len(sessions_result)
-            })
-        print()
+        log("-" * 80)
+        log("Example 4: Active Sessions Analysis")
+        log("-" * 80)
+        if sessions_result.num_rows:
+            log(f"✓ Exported {sessions_result.num_rows} sessions to: active_sessions.parquet")
+            log(f"  Active user sessions: {sessions_result.num_rows}")
+        log()
+        flush_log()
         
         # Create export summary
-        print("-" * 80)
-        print("Creating Export Summary")
-        print("-" * 80)
+        log("-" * 80)
+        log("Creating Export Summary")
+        log("-" * 80)
         
         summary_data = [{
-            "export_timestamp": datetime.now(),
+            "export_timestamp": export_start,
             "server": config.host,
             "database": config.database,
             "total_exports": len(exports),
@@ -311,35 +362,40 @@ def main() -> None:
         
         summary_file = export_dir / "export_summary.parquet"
         parquet_writer.write_to_parquet(summary_data, str(summary_file))
-        print(f"✓ Export summary saved to: {summary_file.name}")
-        print()
+        log(f"✓ Export summary saved to: {summary_file.name}")
+        log()
         
         # Final summary
-        print("=" * 80)
-        print("Export Summary")
-        print("=" * 80)
-        print(f"Export directory: {export_dir}")
-        print(f"Total exports: {len(exports) + 1}")  # +1 for summary file
-        print()
-        print("Exported files:")
+        log("=" * 80)
+        log("Export Summary")
+        log("=" * 80)
+        log(f"Export directory: {export_dir}")
+        log(f"Total exports: {len(exports) + 1}")  # +1 for summary file
+        log()
+        log("Exported files:")
         for i, export in enumerate(exports, 1):
-            print(f"  {i}. {export['file_name']} - {export['row_count']} rows ({export['query_name']})")
-        print(f"  {len(exports) + 1}. {summary_file.name} - Export metadata")
-        print()
-        print("✓ All operations completed successfully!")
-        print()
+            log(f"  {i}. {export['file_name']} - {export['row_count']} rows ({export['query_name']})")
+        log(f"  {len(exports) + 1}. {summary_file.name} - Export metadata")
+        log()
+        log("✓ All operations completed successfully!")
+        log()
+        flush_log()
         
     except Exception as e:
-        print(f"✗ Error: {e}")
+        log(f"✗ Error: {e}")
+        flush_log()
         import traceback
         traceback.print_exc()
         sys.exit(1)
     
     finally:
-        # Clean up connection
+        # Close the executor's cached cursors before the connection
+        if query_executor is not None:
+            query_executor.close()
         sql_conn.close()
-        print("✓ Connection closed")
-        print()
+        log("✓ Connection closed")
+        log()
+        flush_log()
 
 
 if __name__ == "__main__":
@@ -18,201 +18,262 @@ Usage:
     python examples/sqlserver_basic_example.py
 """
 
+import io
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Final
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from config.sqlserver_config import SQLServerConfig
-from src.database.sqlserver_connection import SQLServerConnection
-from src.query.query_executor import QueryExecutor
-from src.export.parquet_writer import ParquetWriter
+
+
+# Status output is collected here and written in a few large chunks
+_log_buffer: io.StringIO = io.StringIO()
+
+
+def log(message: str = "") -> None:
+    """Queue a status line for the next flush_log() call."""
+    _log_buffer.write(message)
+    _log_buffer.write("\n")
+
+
+def flush_log() -> None:
+    """Write all queued status lines to stdout in a single call."""
+    sys.stdout.write(_log_buffer.getvalue())
+    sys.stdout.flush()
+    _log_buffer.seek(0)
+    _log_buffer.truncate()
+
+
+# Directories already created by this process; repeat calls skip the mkdir syscalls
+_created_dirs: set[str] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create path (and parents) once per process and return it."""
+    key: str = str(path)
+    if key not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(key)
+    return path
+
+
+# SQL text lives at module level so it is built once at import time
+_SHOW_TABLES_QUERY: Final[str] = """
+    SELECT s.name AS schema_name, t.name AS table_name
+    FROM sys.tables t
+    INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
+    ORDER BY s.name, t.name
+"""
+
+_DATABASES_QUERY: Final[str] = """
+    SELECT 
+        database_id,
+        name as database_name,
+        create_date,
+        compatibility_level,
+        state_desc as database_state
+    FROM sys.databases
+    ORDER BY database_id
+"""
+
+_TABLES_QUERY: Final[str] = """
+    SELECT TOP 20
+        t.name as table_name,
+        s.name as schema_name,
+        t.create_date,
+        t.modify_date,
+        p.rows as row_count
+    FROM sys.tables t
+    INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
+    LEFT JOIN sys.partitions p ON t.object_id = p.object_id AND p.index_id IN (0, 1)
+    ORDER BY t.name
+"""
+
+_PROPERTIES_QUERY: Final[str] = """
+    SELECT 
+        SERVERPROPERTY('ServerName') as server_name,
+        SERVERPROPERTY('ProductVersion') as product_version,
+        SERVERPROPERTY('ProductLevel') as product_level,
+        SERVERPROPERTY('Edition') as edition,
+        SERVERPROPERTY('EngineEdition') as engine_edition,
+        SERVERPROPERTY('Collation') as collation,
+        GETDATE() as query_time
+"""
 
 
 def main() -> None:
     """Main execution function for SQL Server basic integration example."""
+    # Deferred so importing this module does not load pyodbc and pyarrow
+    from src.database.sqlserver_connection import SQLServerConnection
+    from src.query.query_executor import QueryExecutor
     
-    print("=" * 70)
-    print("SQL Server to Parquet - Basic Integration Example")
-    print("=" * 70)
-    print()
+    log("=" * 70)
+    log("SQL Server to Parquet - Basic Integration Example")
+    log("=" * 70)
+    log()
     
     # Configure SQL Server connection
     # You can use environment variables or hardcode credentials (not recommended for production)
+    # Snapshot the connection variables once instead of one os.getenv per field
+    environ = os.environ
+    env: Dict[str, str] = {
+        key: environ[key]
+        for key in (
+            "SQLSERVER_HOST",
+            "SQLSERVER_PORT",
+            "SQLSERVER_DATABASE",
+            "SQLSERVER_USER",
+            "SQLSERVER_PASSWORD",
+            "SQLSERVER_ENCRYPT",
+            "SQLSERVER_TRUST_CERT",
+        )
+        if key in environ
+    }
     config = SQLServerConfig(
-        host=os.getenv("SQLSERVER_HOST", "localhost"),
-        port=int(os.getenv("SQLSERVER_PORT", "1433")),
-        database=os.getenv("SQLSERVER_DATABASE", "tempdb"),
-        user=os.getenv("SQLSERVER_USER", "sa"),
-        password=os.getenv("SQLSERVER_PASSWORD", "YourStrong!Passw0rd"),
-        encrypt=os.getenv("SQLSERVER_ENCRYPT", "yes"),
-        trust_server_certificate=os.getenv("SQLSERVER_TRUST_CERT", "yes"),
+        host=env.get("SQLSERVER_HOST", "localhost"),
+        port=int(env.get("SQLSERVER_PORT", "1433")),
+        database=env.get("SQLSERVER_DATABASE", "tempdb"),
+        user=env.get("SQLSERVER_USER", "sa"),
+        password=env.get("SQLSERVER_PASSWORD", "YourStrong!Passw0rd"),
+        encrypt=env.get("SQLSERVER_ENCRYPT", "yes"),
+        trust_server_certificate=env.get("SQLSERVER_TRUST_CERT", "yes"),
     )
     
-    print(f"Connecting to SQL Server: {config.host}:{config.port}")
-    print(f"Database: {config.database}")
-    print(f"User: {config.user}")
-    print()
+    log(f"Connecting to SQL Server: {config.host}:{config.port}")
+    log(f"Database: {config.database}")
+    log(f"User: {config.user}")
+    log()
     
     # Create connection
     sql_conn = SQLServerConnection(config)
+    query_executor = None
     
     try:
-        # Establish connection
+        # Establish connection (the driver may print OpenSSL patch notices)
+        flush_log()
         connection = sql_conn.connect()
-        print("✓ Connected to SQL Server successfully!")
-        print()
+        log("✓ Connected to SQL Server successfully!")
+        log()
 
         # Create query executor
         query_executor = QueryExecutor(connection)
 
         # Show all tables in the selected database
-        print("-" * 70)
-        print("All tables in the selected database:")
-        print("-" * 70)
-        show_tables_query = '''
-        SELECT s.name AS schema_name, t.name AS table_name
-        FROM sys.tables t
-        INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
-        ORDER BY s.name, t.name
-        '''
-        tables = query_executor.execute_query(show_tables_query)
+        log("-" * 70)
+        log("All tables in the selected database:")
+        log("-" * 70)
+        tables = query_executor.execute_query(_SHOW_TABLES_QUERY)
         if tables:
             for i, tbl in enumerate(tables, 1):
-                print(f"  {i}. {tbl['schema_name']}.{tbl['table_name']}")
+                log(f"  {i}. {tbl['schema_name']}.{tbl['table_name']}")
         else:
-            print("  (No tables found)")
-        print()
-
-        # Create parquet writer
-        parquet_writer = ParquetWriter()
+            log("  (No tables found)")
+        log()
+        flush_log()
 
         # Create output directory
-        output_dir = Path(os.getcwd()) / "parquetFiles" / "sqlserver"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        print(f"Output directory: {output_dir}")
-        print()
+        output_dir = ensure_dir(Path(os.getcwd()) / "parquetFiles" / "sqlserver")
+        log(f"Output directory: {output_dir}")
+        log()
         
-        # Example 1: Query system databases
-        print("-" * 70)
-        print("Example 1: Exporting System Databases Information")
-        print("-" * 70)
+        # Run all three export queries in one batch; each result set streams to its own file
+        log("Executing export queries...")
+        databases_file = output_dir / "system_databases.parquet"
+        tables_file = output_dir / "system_tables.parquet"
+        properties_file = output_dir / "server_properties.parquet"
+        (
+            (databases_count, databases_preview),
+            (tables_count, tables_preview),
+            (properties_count, properties_preview),
+        ) = query_executor.execute_multi_to_parquet(
+            [_DATABASES_QUERY, _TABLES_QUERY, _PROPERTIES_QUERY],
+            [str(databases_file), str(tables_file), str(properties_file)],
+            preview_rows=5,
+        )
+        log()
         
-        databases_query = """
-        SELECT 
-            database_id,
-            name as database_name,
-            create_date,
-            compatibility_level,
-            state_desc as database_state
-        FROM sys.databases
-        ORDER BY database_id
-        """
+        # Example 1: Query system databases
+        log("-" * 70)
+        log("Example 1: Exporting System Databases Information")
+        log("-" * 70)
         
-        print("Executing query...")
-        databases_result: List[Dict[str, Any]] = query_executor.execute_query(databases_query)
-        print(f"Retrieved {len(databases_result)} databases")
+        log(f"Retrieved {databases_count} databases")
         
-        if databases_result:
-            databases_file = output_dir / "system_databases.parquet"
-            parquet_writer.write_to_parquet(databases_result, str(databases_file))
-            print(f"✓ Exported to: {databases_file}")
+        if databases_count:
+            log(f"✓ Exported to: {databases_file}")
             
             # Display sample data
-            print("\nSample data (first 3 records):")
-            for i, db in enumerate(databases_result[:3], 1):
-                print(f"  {i}. {db.get('database_name')} (ID: {db.get('database_id')})")
-        print()
+            log("\nSample data (first 3 records):")
+            for i, db in enumerate(databases_preview[:3], 1):
+                log(f"  {i}. {db.get('database_name')} (ID: {db.get('database_id')})")
+        log()
+        flush_log()
         
         # Example 2: Query system tables
-        print("-" * 70)
-        print("Example 2: Exporting System Tables Information")
-        print("-" * 70)
+        log("-" * 70)
+        log("Example 2: Exporting System Tables Information")
+        log("-" * 70)
         
-        tables_query = """
-        SELECT TOP 20
-            t.name as table_name,
-            s.name as schema_name,
-            t.create_date,
-            t.modify_date,
-            p.rows as row_count
-        FROM sys.tables t
-        INNER JOIN sys.schemas s ON t.schema_id = s.schema_id
-        LEFT JOIN sys.partitions p ON t.object_id = p.object_id AND p.index_id IN (0, 1)
-        ORDER BY t.name
-        """
+        log(f"Retrieved {tables_count} tables")
         
-        print("Executing query...")
-        tables_result: List[Dict[str, Any]] = query_executor.execute_query(tables_query)
-        print(f"Retrieved {len(tables_result)} tables")
-        
-        if tables_result:
-            tables_file = output_dir / "system_tables.parquet"
-            parquet_writer.write_to_parquet(tables_result, str(tables_file))
-            print(f"✓ Exported to: {tables_file}")
+        if tables_count:
+            log(f"✓ Exported to: {tables_file}")
             
             # Display sample data
-            print("\nSample data (first 5 records):")
-            for i, table in enumerate(tables_result[:5], 1):
-                print(f"  {i}. {table.get('schema_name')}.{table.get('table_name')} ({table.get('row_count')} rows)")
-        print()
+            log("\nSample data (first 5 records):")
+            for i, table in enumerate(tables_preview, 1):
+                log(f"  {i}. {table.get('schema_name')}.{table.get('table_name')} ({table.get('row_count')} rows)")
+        log()
+        flush_log()
         
         # Example 3: Query server properties
-        print("-" * 70)
-        print("Example 3: Exporting Server Properties")
-        print("-" * 70)
-        
-        properties_query = """
-        SELECT 
-            SERVERPROPERTY('ServerName') as server_name,
-            SERVERPROPERTY('ProductVersion') as product_version,
-            SERVERPROPERTY('ProductLevel') as product_level,
-            SERVERPROPERTY('Edition') as edition,
-            SERVERPROPERTY('EngineEdition') as engine_edition,
-            SERVERPROPERTY('Collation') as collation,
-            GETDATE() as query_time
-        """
-        
-        print("Executing query...")
-        properties_result: List[Dict[str, Any]] = query_executor.execute_query(properties_query)
+        log("-" * 70)
+        log("Example 3: Exporting Server Properties")
+        log("-" * 70)
         
-        if properties_result:
-            properties_file = output_dir / "server_properties.parquet"
-            parquet_writer.write_to_parquet(properties_result, str(properties_file))
-            print(f"✓ Exported to: {properties_file}")
+        if properties_count:
+            log(f"✓ Exported to: {properties_file}")
             
             # Display server info
-            if len(properties_result) > 0:
-                props = properties_result[0]
-                print("\nServer Information:")
-                print(f"  Server: {props.get('server_name')}")
-                print(f"  Version: {props.get('product_version')}")
-                print(f"  Edition: {props.get('edition')}")
-        print()
+            if properties_preview:
+                props = properties_preview[0]
+                log("\nServer Information:")
+                log(f"  Server: {props.get('server_name')}")
+                log(f"  Version: {props.get('product_version')}")
+                log(f"  Edition: {props.get('edition')}")
+        log()
+        flush_log()
         
         # Summary
-        print("=" * 70)
-        print("Export Summary")
-        print("=" * 70)
-        print(f"✓ All queries executed successfully!")
-        print(f"✓ Parquet files saved to: {output_dir}")
-        print(f"✓ Total files created: 3")
-        print()
+        log("=" * 70)
+        log("Export Summary")
+        log("=" * 70)
+        log(f"✓ All queries executed successfully!")
+        log(f"✓ Parquet files saved to: {output_dir}")
+        # Empty result sets write no file
+        files_created = sum(1 for count in (databases_count, tables_count, properties_count) if count)
+        log(f"✓ Total files created: {files_created}")
+        log()
         
     except Exception as e:
-        print(f"✗ Error: {e}")
+        log(f"✗ Error: {e}")
+        flush_log()
         import traceback
         traceback.print_exc()
         sys.exit(1)
     
     finally:
-        # Clean up connection
+        # Close the executor's cached cursors before the connection
+        if query_executor is not None:
+            query_executor.close()
         sql_conn.close()
-        print("✓ Connection closed")
-        print()
+        log("✓ Connection closed")
+        log()
+        flush_log()
 
 
 if __name__ == "__main__":
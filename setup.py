@@ -10,6 +10,7 @@ setup(
     package_dir={'': 'src'},
     install_requires=[
         'mysql-connector-python',
+        'numpy',
         'pyarrow',
     ],
     classifiers=[
@@ -17,5 +18,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.10',
 )
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import Optional
 import mysql.connector
 from mysql.connector import MySQLConnection as MySQLConn
+from mysql.connector.pooling import MySQLConnectionPool
 from config.database_config import DatabaseConfig
 
 class MySQLConnection:
@@ -17,6 +18,17 @@ class MySQLConnection:
         )
         return self.connection
 
+    def create_pool(self, pool_size: int = 10, pool_name: str = "upe") -> MySQLConnectionPool:
+        # Pass the pool to QueryExecutor to reuse connections across queries
+        return MySQLConnectionPool(
+            pool_name=pool_name,
+            pool_size=pool_size,
+            host=self.config.host,
+            user=self.config.user,
+            password=self.config.password,
+            database=self.config.database
+        )
+
     def close(self) -> None:
         if self.connection:
             self.connection.close()
\ No newline at end of file
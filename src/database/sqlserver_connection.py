@@ -1,10 +1,294 @@
+import atexit
+import copy
+import functools
+import itertools
 import pyodbc
 import os
+import re
 import sys
 import tempfile
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from typing import Optional, List, Dict, Tuple, Any
 from config.sqlserver_config import SQLServerConfig
 
+# Pooling is done in Python below; the ODBC driver manager's own pooling
+# behaves inconsistently across unixODBC builds, so it is switched off
+pyodbc.pooling = False
+
+# Idle (connection, release time) pairs per connection string; the most
+# recently released is last. Each caller's config.pool_max_size bounds its
+# own releases, so configs sharing a connection string may differ in size.
+_POOL: Dict[str, List[Tuple[pyodbc.Connection, float]]] = {}
+_POOL_LOCK: threading.Lock = threading.Lock()
+
+# Pooled connections idle for longer than this are probed before reuse
+_POOL_VALIDATE_AFTER_SECONDS: float = 30.0
+
+# ODBC connection attribute id for the TDS network packet size
+_SQL_ATTR_PACKET_SIZE: int = 112
+
+# How long a live is_connected(deep=True) probe result is trusted
+_PROBE_TTL_SECONDS: float = 5.0
+
+# OpenSSL configuration content to allow legacy TLS
+_OPENSSL_LEGACY_CONFIG: str = """openssl_conf = openssl_init
+
+[openssl_init]
+ssl_conf = ssl_sect
+
+[ssl_sect]
+system_default = system_default_sect
+
+[system_default_sect]
+CipherString = DEFAULT:@SECLEVEL=0
+"""
+
+# Legacy OpenSSL config written for this process, shared by all connections
+_OPENSSL_PATCH_PATH: Optional[str] = None
+# Connections currently relying on the legacy config, and the OPENSSL_CONF
+# value to put back once the last of them is closed
+_OPENSSL_PATCH_USERS: int = 0
+_OPENSSL_PREVIOUS_CONF: Optional[str] = None
+_OPENSSL_LOCK: threading.Lock = threading.Lock()
+
+
+def _remove_openssl_patch_file() -> None:
+    """Delete the process's legacy OpenSSL config file (registered with atexit)."""
+    if _OPENSSL_PATCH_PATH and os.path.exists(_OPENSSL_PATCH_PATH):
+        try:
+            os.remove(_OPENSSL_PATCH_PATH)
+        except OSError:
+            pass  # Silent cleanup failure
+
+
+# validate_connection_prerequisites() results: key -> (monotonic time, results)
+_VALIDATE_CACHE: Dict[Tuple[str, str, str, bool], Tuple[float, Dict[str, Any]]] = {}
+_VALIDATE_CACHE_TTL_SECONDS: float = 60.0
+
+# Initial values for validate_connection_prerequisites(); the list entries
+# are replaced with fresh lists per call since callers append to them
+_BASE_RESULTS: Tuple[Tuple[str, Any], ...] = (
+    ('odbc_drivers_available', ()),
+    ('recommended_driver', None),
+    ('pyodbc_version', None),
+    ('config_valid', True),
+    ('config_issues', ()),
+)
+
+
+# Classifies a connection error in one search. Each alternative is a set of
+# lookaheads from the start of the text, so the first alternative that holds
+# wins and the buckets keep their priority order regardless of where in the
+# message the keywords appear.
+_ERROR_CLASS_RE: "re.Pattern[str]" = re.compile(
+    r"\A(?:"
+    r"(?=.*tcp provider)(?=.*(?:10054|10061))(?P<tcp>)"
+    r"|(?=.*login failed)(?P<login>)"
+    r"|(?=.*cannot open database)(?P<database>)"
+    r"|(?=.*(?:ssl|certificate))(?P<ssl>)"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Error class -> (suggestions, extra macOS suggestion).
+# "{host}" is filled in only when the message is built.
+_SUGGESTIONS_BY_CLASS: Dict[str, Tuple[Tuple[str, ...], Optional[str]]] = {
+    "tcp": (
+        (
+            "Check if SQL Server is running and accepting TCP connections",
+            "Verify firewall allows port 1433 (or your custom port)",
+            "Try: nc -zv {host} 1433 to test network connectivity",
+            "Consider setting encrypt=no and trust_server_certificate=yes for local connections",
+        ),
+        "On macOS: This may be an OpenSSL 3.0 TLS compatibility issue",
+    ),
+    "login": (
+        (
+            "Verify username and password are correct",
+            "Check if SQL Server authentication is enabled (not just Windows auth)",
+            "Ensure user has permission to access the database",
+        ),
+        None,
+    ),
+    "database": (
+        (
+            "Verify database name is correct",
+            "Check if user has access to the specified database",
+            "Try connecting without specifying database first",
+        ),
+        None,
+    ),
+    "ssl": (
+        (
+            "Try setting encrypt=no for local connections",
+            "Set trust_server_certificate=yes for self-signed certificates",
+            "Check SSL/TLS configuration on SQL Server",
+        ),
+        None,
+    ),
+}
+
+
+# Preferred driver order for SQL Server 2022 compatibility
+_PREFERRED_DRIVERS: Tuple[str, ...] = (
+    "ODBC Driver 18 for SQL Server",
+    "ODBC Driver 17 for SQL Server",
+    "SQL Server Native Client 11.0",
+    "SQL Server",
+)
+_PREFERRED_DRIVERS_SET: frozenset[str] = frozenset(_PREFERRED_DRIVERS)
+
+
+@functools.lru_cache(maxsize=1)
+def _all_drivers() -> Tuple[str, ...]:
+    """
+    Return the ODBC drivers registered with the driver manager.
+    
+    Installed drivers do not change while the process runs, so the driver
+    manager is only queried once.
+    """
+    return tuple(pyodbc.drivers())
+
+
+def _take_idle(conn_str: str) -> Optional[Tuple[pyodbc.Connection, float]]:
+    """Pop the most recently released idle connection for conn_str, if any."""
+    with _POOL_LOCK:
+        idle = _POOL.get(conn_str)
+        return idle.pop() if idle else None
+
+
+def close_pooled_connections() -> None:
+    """Close and discard every idle connection held in the process-wide pool."""
+    with _POOL_LOCK:
+        pools = list(_POOL.values())
+        _POOL.clear()
+    for idle in pools:
+        for connection, _ in idle:
+            try:
+                connection.close()
+            except pyodbc.Error:
+                pass
+
+
+# Fixed part of every connection string, rendered with a single str.format.
+# SERVER carries no port for better compatibility; MARS ({7}) is optional and
+# the timeouts are set for better stability.
+_CONN_STR_TEMPLATE: str = (
+    "DRIVER={{{0}}};SERVER={1};DATABASE={2};UID={3};PWD={4};"
+    "Encrypt={5};TrustServerCertificate={6}{7};"
+    "Connection Timeout=30;Login Timeout=30"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_conn_str(
+    driver: str,
+    host: str,
+    database: str,
+    user: str,
+    password: str,
+    encrypt: str,
+    trust_server_certificate: str,
+    mars: str,
+    port: int,
+    extra_items: Tuple[Tuple[str, str], ...]
+) -> str:
+    """
+    Format an ODBC connection string from resolved connection settings.
+    
+    Memoized on its (hashable) arguments so reconnecting with the same
+    settings reuses the previously built string.
+    
+    Returns:
+        Formatted connection string for pyodbc
+    """
+    # SSL/Encryption settings optimized for local SQL Server 2022
+    # Match sqlcmd default behavior for better compatibility
+    if encrypt == "no":
+        trust_server_certificate = "yes"  # Required even with Encrypt=no for modern SQL Server
+    
+    base = _CONN_STR_TEMPLATE.format(
+        driver,
+        host,
+        database,
+        user,
+        password,
+        encrypt,
+        trust_server_certificate,
+        ";MARS_Connection=yes" if mars == "yes" else "",
+    )
+    
+    # Port handling - add as separate parameter if not default
+    port_items: Tuple[str, ...] = (f"Port={port}",) if port != 1433 else ()
+    
+    # Add any extra connection string parameters
+    return ";".join(itertools.chain(
+        (base,), port_items, (f"{key}={value}" for key, value in extra_items)
+    ))
+
+
+class _ArraysizeConnection:
+    """
+    pyodbc.Connection proxy whose cursors carry the configured arraysize.
+    
+    pyodbc.Connection is a C type that can be neither subclassed nor have
+    cursor() patched, so connect() hands out this thin delegate instead.
+    pyodbc cursors default to arraysize=1, which makes fetchmany() without
+    an explicit size one round-trip per row. Every other attribute reads
+    and writes through to the wrapped connection.
+    """
+    
+    __slots__ = ('raw', 'arraysize')
+    
+    def __init__(self, connection: pyodbc.Connection, arraysize: int) -> None:
+        """
+        Wrap a connection.
+        
+        Args:
+            connection: Underlying pyodbc connection
+            arraysize: arraysize set on every cursor opened through the proxy
+        """
+        object.__setattr__(self, 'raw', connection)
+        object.__setattr__(self, 'arraysize', arraysize)
+    
+    def cursor(self) -> pyodbc.Cursor:
+        """
+        Open a cursor on the wrapped connection with the configured arraysize.
+        
+        Returns:
+            pyodbc.Cursor with arraysize set
+        """
+        cursor = self.raw.cursor()
+        cursor.arraysize = self.arraysize
+        return cursor
+    
+    def execute(self, sql: str, *params: Any) -> pyodbc.Cursor:
+        """
+        Execute a statement on a new cursor, like pyodbc.Connection.execute.
+        
+        Args:
+            sql: SQL statement
+            *params: Bind parameters
+            
+        Returns:
+            The cursor the statement ran on
+        """
+        return self.cursor().execute(sql, *params)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.raw, name, value)
+    
+    def __enter__(self) -> "_ArraysizeConnection":
+        self.raw.__enter__()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.raw.__exit__(exc_type, exc_val, exc_tb)
+
 
 class SQLServerConnection:
     """
@@ -24,7 +308,16 @@ class SQLServerConnection:
         """
         self.config: SQLServerConfig = config
         self._connection: Optional[pyodbc.Connection] = None
-        self._openssl_patch_file: Optional[str] = None  # Track patch file for cleanup
+        self._openssl_patch_file: Optional[str] = None  # Patch file this instance pointed OPENSSL_CONF at
+        self._pool_key: Optional[str] = None  # Connection string the current connection is pooled under
+        # The config is frozen, so this never needs invalidating
+        self._cached_conn_str: Optional[str] = None
+        # Time and outcome of the last live is_connected(deep=True) probe
+        self._last_probe: float = float("-inf")
+        self._last_probe_ok: bool = False
+        self._probe_cursor: Optional[pyodbc.Cursor] = None
+        # Proxy handed out by connect() for the current connection
+        self._handle: Optional[_ArraysizeConnection] = None
     
     def _detect_odbc_drivers(self) -> List[str]:
         """
@@ -34,26 +327,14 @@ class SQLServerConnection:
             List of available drivers in preference order
         """
         try:
-            all_drivers = pyodbc.drivers()
-            sql_drivers = []
-            
-            # Preferred driver order for SQL Server 2022 compatibility
-            preferred_drivers = [
-                "ODBC Driver 18 for SQL Server",
-                "ODBC Driver 17 for SQL Server", 
-                "SQL Server Native Client 11.0",
-                "SQL Server"
-            ]
-            
-            for preferred in preferred_drivers:
-                if preferred in all_drivers:
-                    sql_drivers.append(preferred)
+            all_drivers = _all_drivers()
+            sql_drivers = [driver for driver in _PREFERRED_DRIVERS if driver in all_drivers]
             
-            # Add any other SQL Server drivers found
-            for driver in all_drivers:
-                if "SQL Server" in driver and driver not in sql_drivers:
-                    sql_drivers.append(driver)
-                    
+            # Add any other SQL Server drivers found, in driver manager order
+            sql_drivers.extend(
+                driver for driver in all_drivers
+                if "SQL Server" in driver and driver not in _PREFERRED_DRIVERS_SET
+            )
             return sql_drivers
         except Exception:
             return []
@@ -81,51 +362,60 @@ class SQLServerConnection:
         
         This creates a process-specific OpenSSL configuration that sets
         SECLEVEL=0 to allow connections to SQL Servers with legacy TLS.
+        The file is written once per process and reused by later connections.
+        Each call must be paired with _cleanup_openssl_patch(); the previous
+        OPENSSL_CONF is restored when the last patched connection is done.
         
         Returns:
-            Path to temporary config file for cleanup
+            Path to the temporary config file
         """
-        # OpenSSL configuration content to allow legacy TLS
-        config_content = """openssl_conf = openssl_init
-
-[openssl_init]
-ssl_conf = ssl_sect
-
-[ssl_sect]
-system_default = system_default_sect
-
-[system_default_sect]
-CipherString = DEFAULT:@SECLEVEL=0
-"""
-        
-        # Create temporary config file with unique name
-        temp_dir = tempfile.gettempdir()
-        config_path = os.path.join(temp_dir, f"openssl_legacy_mysql_parquet_{os.getpid()}.cnf")
-        
-        with open(config_path, 'w') as f:
-            f.write(config_content)
-        
-        # Set environment variable BEFORE making any ODBC connections
-        os.environ['OPENSSL_CONF'] = config_path
-        
-        return config_path
+        global _OPENSSL_PATCH_PATH, _OPENSSL_PATCH_USERS, _OPENSSL_PREVIOUS_CONF
+        
+        with _OPENSSL_LOCK:
+            # Written by an earlier connection in this process unless missing
+            if not (_OPENSSL_PATCH_PATH and os.path.exists(_OPENSSL_PATCH_PATH)):
+                # Create temporary config file with unique name
+                temp_dir = tempfile.gettempdir()
+                config_path = os.path.join(temp_dir, f"openssl_legacy_mysql_parquet_{os.getpid()}.cnf")
+                
+                with open(config_path, 'w') as f:
+                    f.write(_OPENSSL_LEGACY_CONFIG)
+                
+                # Removed once at interpreter exit rather than per connection, so
+                # concurrent connections never race on deleting a shared file
+                if _OPENSSL_PATCH_PATH is None:
+                    atexit.register(_remove_openssl_patch_file)
+                _OPENSSL_PATCH_PATH = config_path
+            
+            if _OPENSSL_PATCH_USERS == 0:
+                _OPENSSL_PREVIOUS_CONF = os.environ.get('OPENSSL_CONF')
+            _OPENSSL_PATCH_USERS += 1
+            
+            # Set environment variable BEFORE making any ODBC connections
+            os.environ['OPENSSL_CONF'] = _OPENSSL_PATCH_PATH
+            return _OPENSSL_PATCH_PATH
     
     def _cleanup_openssl_patch(self) -> None:
         """
-        Clean up temporary OpenSSL configuration.
+        Drop this instance's use of the legacy OpenSSL config.
         
-        Removes the temporary config file and environment variable.
+        Called after a failed patched attempt and from close(). Once no
+        patched connection is left, OPENSSL_CONF gets its previous value back
+        (or is unset), unless something else has changed it since. The shared
+        file itself is removed at interpreter exit.
         """
-        if self._openssl_patch_file and os.path.exists(self._openssl_patch_file):
-            try:
-                os.remove(self._openssl_patch_file)
-                # Remove from environment if it points to our file
-                if (os.environ.get('OPENSSL_CONF') == self._openssl_patch_file):
+        global _OPENSSL_PATCH_USERS
+        
+        if self._openssl_patch_file is None:
+            return
+        with _OPENSSL_LOCK:
+            _OPENSSL_PATCH_USERS -= 1
+            if _OPENSSL_PATCH_USERS == 0 and os.environ.get('OPENSSL_CONF') == self._openssl_patch_file:
+                if _OPENSSL_PREVIOUS_CONF is None:
                     del os.environ['OPENSSL_CONF']
-            except Exception:
-                pass  # Silent cleanup failure
-            finally:
-                self._openssl_patch_file = None
+                else:
+                    os.environ['OPENSSL_CONF'] = _OPENSSL_PREVIOUS_CONF
+        self._openssl_patch_file = None
     
     def _build_error_message(self, error: pyodbc.Error) -> str:
         """
@@ -137,44 +427,19 @@ CipherString = DEFAULT:@SECLEVEL=0
         Returns:
             Enhanced error message with suggestions
         """
-        error_msg = str(error).lower()
-        suggestions = []
+        suggestions: Tuple[str, ...] = ()
+        match = _ERROR_CLASS_RE.match(str(error))
+        if match:
+            suggestions, macos_hint = _SUGGESTIONS_BY_CLASS[match.lastgroup]
+            if macos_hint is not None and sys.platform == "darwin":
+                suggestions += (macos_hint,)
         
-        if "tcp provider" in error_msg and ("10054" in error_msg or "10061" in error_msg):
-            suggestions.extend([
-                "Check if SQL Server is running and accepting TCP connections",
-                "Verify firewall allows port 1433 (or your custom port)",
-                "Try: nc -zv {0} 1433 to test network connectivity".format(self.config.host),
-                "Consider setting encrypt=no and trust_server_certificate=yes for local connections"
-            ])
-            
-            # Add macOS-specific suggestion
-            if sys.platform == "darwin":
-                suggestions.append("On macOS: This may be an OpenSSL 3.0 TLS compatibility issue")
-                
-        elif "login failed" in error_msg:
-            suggestions.extend([
-                "Verify username and password are correct",
-                "Check if SQL Server authentication is enabled (not just Windows auth)",
-                "Ensure user has permission to access the database"
-            ])
-        elif "cannot open database" in error_msg:
-            suggestions.extend([
-                "Verify database name is correct", 
-                "Check if user has access to the specified database",
-                "Try connecting without specifying database first"
-            ])
-        elif "ssl" in error_msg or "certificate" in error_msg:
-            suggestions.extend([
-                "Try setting encrypt=no for local connections",
-                "Set trust_server_certificate=yes for self-signed certificates",
-                "Check SSL/TLS configuration on SQL Server"
-            ])
-        
-        suggestion_text = "\n".join([f"  - {s}" for s in suggestions]) if suggestions else ""
         error_details = f"Failed to connect to SQL Server: {error}"
-        if suggestion_text:
-            error_details += f"\n\nTroubleshooting suggestions:\n{suggestion_text}"
+        if suggestions:
+            host = self.config.host
+            error_details += "\n\nTroubleshooting suggestions:\n" + "\n".join(
+                f"  - {s.format(host=host)}" for s in suggestions
+            )
         
         return error_details
     
@@ -182,9 +447,14 @@ CipherString = DEFAULT:@SECLEVEL=0
         """
         Build optimized ODBC connection string for SQL Server 2022/macOS compatibility.
         
+        Built once per instance; the config is immutable.
+        
         Returns:
             Formatted connection string for pyodbc
         """
+        if self._cached_conn_str is not None:
+            return self._cached_conn_str
+        
         # Use configured driver if available, otherwise detect best match
         available_drivers = self._detect_odbc_drivers()
         if self.config.driver in available_drivers:
@@ -192,53 +462,123 @@ CipherString = DEFAULT:@SECLEVEL=0
         else:
             driver = available_drivers[0] if available_drivers else self.config.driver
         
-        # Base connection string - separate SERVER from port for better compatibility
-        parts = [
-            f"DRIVER={{{driver}}}",
-            f"SERVER={self.config.host}",  # No port in SERVER for better compatibility
-            f"DATABASE={self.config.database}",
-            f"UID={self.config.user}",
-            f"PWD={self.config.password}",
-        ]
-        
-        # SSL/Encryption settings optimized for local SQL Server 2022
-        # Match sqlcmd default behavior for better compatibility
-        if self.config.encrypt.lower() == "no":
-            parts.extend([
-                "Encrypt=no",
-                "TrustServerCertificate=yes"  # Required even with Encrypt=no for modern SQL Server
-            ])
-        else:
-            parts.extend([
-                f"Encrypt={self.config.encrypt}",
-                f"TrustServerCertificate={self.config.trust_server_certificate}"
-            ])
+        extra_items: Tuple[Tuple[str, str], ...] = (
+            tuple(self.config.extra.items()) if self.config.extra else ()
+        )
+        self._cached_conn_str = _build_conn_str(
+            driver,
+            self.config.host,
+            self.config.database,
+            self.config.user,
+            self.config.password,
+            self.config.encrypt,
+            self.config.trust_server_certificate,
+            self.config.mars,
+            self.config.port,
+            extra_items
+        )
+        return self._cached_conn_str
+    
+    def _acquire_pooled(self, conn_str: str) -> Optional[pyodbc.Connection]:
+        """
+        Take a live idle connection for conn_str from the pool, if any.
         
-        # MARS connection if enabled
-        if self.config.mars.lower() == "yes":
-            parts.append(f"MARS_Connection={self.config.mars}")
+        Connections idle for longer than the validation TTL are probed with
+        SELECT 1 and discarded if the probe fails.
         
-        # Timeout settings for better stability
-        parts.extend([
-            "Connection Timeout=30",
-            "Login Timeout=30"
-        ])
+        Args:
+            conn_str: Connection string the pool is keyed by
+            
+        Returns:
+            A reusable pyodbc.Connection, or None if the pool has none
+        """
+        if self.config.pool_max_size <= 0:
+            return None
         
-        # Port handling - add as separate parameter if not default
-        if self.config.port != 1433:
-            parts.append(f"Port={self.config.port}")
+        while True:
+            entry = _take_idle(conn_str)
+            if entry is None:
+                return None
+            
+            connection, released_at = entry
+            if time.monotonic() - released_at < _POOL_VALIDATE_AFTER_SECONDS:
+                return connection
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1")
+                cursor.close()
+                return connection
+            except pyodbc.Error:
+                try:
+                    connection.close()
+                except pyodbc.Error:
+                    pass
+    
+    def _release_to_pool(self, connection: pyodbc.Connection) -> bool:
+        """
+        Return a connection to the pool after rolling back any open transaction.
+        
+        Only the transaction is undone; the rest of the session (current
+        database, SET options, #temp tables, cursors still open on it) is
+        passed on to the next connect(). That is why pooling is opt-in
+        through config.pool_max_size.
         
-        # Add any extra connection string parameters
-        if self.config.extra:
-            for key, value in self.config.extra.items():
-                parts.append(f"{key}={value}")
+        Args:
+            connection: Connection previously handed out by connect()
+            
+        Returns:
+            True if the connection was pooled, False if the caller must close it
+        """
+        if self._pool_key is None or self.config.pool_max_size <= 0:
+            return False
         
-        return ";".join(parts)
+        try:
+            connection.rollback()
+        except pyodbc.Error:
+            return False
+        with _POOL_LOCK:
+            idle = _POOL.setdefault(self._pool_key, [])
+            if len(idle) >= self.config.pool_max_size:
+                return False
+            idle.append((connection, time.monotonic()))
+        return True
     
-    def connect(self) -> pyodbc.Connection:
+    def _open_connection(self, conn_str: str) -> pyodbc.Connection:
+        """
+        Open a new ODBC connection, applying pre-connect attributes from the config.
+        
+        Args:
+            conn_str: Connection string for pyodbc
+            
+        Returns:
+            Newly opened pyodbc.Connection
+        """
+        # SQL_ATTR_PACKET_SIZE only takes effect if set before the login
+        if self.config.packet_size:
+            return pyodbc.connect(
+                conn_str, attrs_before={_SQL_ATTR_PACKET_SIZE: self.config.packet_size}
+            )
+        return pyodbc.connect(conn_str)
+    
+    def connect(self) -> "_ArraysizeConnection":
         """
         Establish connection to SQL Server with enhanced error handling and OpenSSL patch fallback.
         
+        Returns:
+            pyodbc.Connection proxy whose cursors use the configured arraysize
+            
+        Raises:
+            Exception: If connection fails with detailed error information
+        """
+        connection: pyodbc.Connection = self._raw_connection()
+        if self._handle is None or self._handle.raw is not connection:
+            self._handle = _ArraysizeConnection(connection, self.config.arraysize)
+        return self._handle
+    
+    def _raw_connection(self) -> pyodbc.Connection:
+        """
+        Return the underlying pyodbc connection, connecting first if needed.
+        
         Returns:
             pyodbc.Connection object
             
@@ -247,21 +587,31 @@ CipherString = DEFAULT:@SECLEVEL=0
         """
         if self._connection is None:
             conn_str: str = self._build_connection_string()
+            self._pool_key = conn_str
+            
+            # Reuse an idle pooled connection and skip the login/TLS handshake
+            self._connection = self._acquire_pooled(conn_str)
+            if self._connection is not None:
+                return self._connection
             
             # Check if OpenSSL configuration is already set externally
             if os.environ.get('OPENSSL_CONF'):
                 # Skip auto-patching if OPENSSL_CONF is already configured
                 # This is common when launched from a script that pre-configures OpenSSL
+                if _OPENSSL_PATCH_PATH and os.environ['OPENSSL_CONF'] == _OPENSSL_PATCH_PATH:
+                    # Set by another open connection's patch; keep it until this one closes too
+                    self._openssl_patch_file = self._apply_openssl_legacy_patch()
                 try:
-                    self._connection = pyodbc.connect(conn_str)
+                    self._connection = self._open_connection(conn_str)
                     return self._connection
                 except pyodbc.Error as e:
+                    self._cleanup_openssl_patch()
                     # Re-raise with enhanced error message
                     raise Exception(self._build_error_message(e))
             
             # First attempt - normal connection
             try:
-                self._connection = pyodbc.connect(conn_str)
+                self._connection = self._open_connection(conn_str)
                 return self._connection
                 
             except pyodbc.Error as e:
@@ -278,12 +628,12 @@ CipherString = DEFAULT:@SECLEVEL=0
                         print(f"✅ OpenSSL patch applied: {os.path.basename(self._openssl_patch_file)}")
                         
                         # Retry connection with patch
-                        self._connection = pyodbc.connect(conn_str)
+                        self._connection = self._open_connection(conn_str)
                         print("✅ Connection successful with OpenSSL legacy patch!")
                         return self._connection
                         
                     except pyodbc.Error as patch_error:
-                        # Clean up patch file on failure
+                        # Undo the OPENSSL_CONF override on failure
                         self._cleanup_openssl_patch()
                         
                         # Build combined error message
@@ -297,20 +647,31 @@ CipherString = DEFAULT:@SECLEVEL=0
                 # Re-raise with enhanced error message if not OpenSSL issue or patch disabled
                 raise Exception(self._build_error_message(e))
         
+        return self._connection
+    
     def validate_connection_prerequisites(self) -> Dict[str, Any]:
         """
         Pre-flight validation before connection attempts.
         
+        Results are cached process-wide for 60 seconds per (host, user,
+        driver, password set) combination, so frameworks calling this before
+        every connect() do not repeat the checks. Each call returns its own
+        copy, so callers may modify it.
+        
         Returns:
             Dictionary with validation results and diagnostic info
         """
-        results = {
-            'odbc_drivers_available': [],
-            'recommended_driver': None,
-            'pyodbc_version': None,
-            'config_valid': True,
-            'config_issues': []
-        }
+        key: Tuple[str, str, str, bool] = (
+            self.config.host, self.config.user, self.config.driver, bool(self.config.password)
+        )
+        now = time.monotonic()
+        cached = _VALIDATE_CACHE.get(key)
+        if cached is not None and now - cached[0] < _VALIDATE_CACHE_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
+        
+        results: Dict[str, Any] = dict(_BASE_RESULTS)
+        results['odbc_drivers_available'] = []
+        results['config_issues'] = []
         
         # Check pyodbc availability and version
         try:
@@ -344,48 +705,97 @@ CipherString = DEFAULT:@SECLEVEL=0
             results['config_issues'].append(f"Config validation error: {e}")
             results['config_valid'] = False
         
-        return results
+        _VALIDATE_CACHE[key] = (now, results)
+        return copy.deepcopy(results)
     
     def close(self) -> None:
         """
-        Close the SQL Server connection and clean up OpenSSL patch if applied.
+        Release the SQL Server connection.
+        
+        With pooling enabled (config.pool_max_size > 0) the connection is
+        rolled back and returned to the process-wide pool for reuse, unless
+        the pool is full; otherwise it is closed. If the connection needed
+        the OpenSSL legacy patch, OPENSSL_CONF is restored once the last such
+        connection is closed.
         """
+        if self._probe_cursor is not None:
+            try:
+                self._probe_cursor.close()
+            except pyodbc.Error:
+                pass
+            self._probe_cursor = None
+        
         if self._connection is not None:
             try:
-                self._connection.close()
+                if not self._release_to_pool(self._connection):
+                    self._connection.close()
             except pyodbc.Error as e:
                 print(f"Warning: Error closing connection: {e}")
             finally:
                 self._connection = None
+                self._handle = None
+                self._last_probe = float("-inf")
+                self._cleanup_openssl_patch()
+    
+    def cursor(self) -> pyodbc.Cursor:
+        """
+        Open a cursor on the current connection with the configured arraysize.
         
-        # Clean up OpenSSL patch
-        self._cleanup_openssl_patch()
+        pyodbc cursors default to arraysize=1, so fetchmany() without an
+        explicit size would make one round-trip per row.
+        
+        Returns:
+            pyodbc.Cursor with arraysize set from the config
+            
+        Raises:
+            Exception: If connecting fails (see connect())
+        """
+        return self.connect().cursor()
     
-    def is_connected(self) -> bool:
+    def is_connected(self, deep: bool = False) -> bool:
         """
         Check if connection is active.
         
+        By default only local connection state is inspected, which costs no
+        network round-trip. With deep=True the server is probed with SELECT 1;
+        the probe result is reused for a few seconds so polling stays cheap.
+        
+        Args:
+            deep: Verify the connection with a live server round-trip
+            
         Returns:
             True if connected, False otherwise
         """
-        if self._connection is None:
+        if self._connection is None or getattr(self._connection, 'closed', False):
             return False
+        if not deep:
+            return True
+        
+        now = time.monotonic()
+        if now - self._last_probe < _PROBE_TTL_SECONDS:
+            return self._last_probe_ok
         
         try:
-            # Try to execute a simple query to check connection
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            return True
+            # Reuse one cursor for probes instead of allocating ODBC handles each time
+            if self._probe_cursor is None:
+                self._probe_cursor = self._connection.cursor()
+            self._probe_cursor.execute("SELECT 1")
+            self._probe_cursor.fetchone()
+            ok = True
         except (pyodbc.Error, AttributeError):
-            return False
+            self._probe_cursor = None
+            ok = False
+        
+        self._last_probe = now
+        self._last_probe_ok = ok
+        return ok
     
-    def __enter__(self) -> pyodbc.Connection:
+    def __enter__(self) -> "_ArraysizeConnection":
         """
         Context manager entry.
         
         Returns:
-            pyodbc.Connection object
+            pyodbc.Connection proxy, as returned by connect()
         """
         return self.connect()
     
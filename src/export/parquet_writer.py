@@ -1,17 +1,745 @@
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Sequence, Tuple, Union, Optional
+import datetime
+import decimal
+import functools
+import os
+from operator import itemgetter
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from mysql.connector.constants import FieldFlag, FieldType
+
+# A row is either a mapping of column name to value or a positional tuple
+Row = Union[Mapping[str, Any], Sequence[Any]]
+
+# Defaults for every file written here: ZSTD at a fast level compresses numeric
+# SQL columns well, and 128k-row groups keep downstream reads to few page decodes
+_COMPRESSION: str = 'zstd'
+_ZSTD_LEVEL: int = 1
+_ROW_GROUP_SIZE: int = 128_000
+
+# numpy dtypes for the Python types pyodbc reports as cursor.description type_code
+_NUMPY_DTYPES: Dict[type, np.dtype] = {
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+    bool: np.dtype(np.bool_),
+    datetime.datetime: np.dtype('datetime64[us]'),
+}
+
+# Column types for which a whole batch of rows is converted as one 2-D numpy
+# array; numpy rejects NULLs for integers, and NaN marks them for floats
+_MATRIX_DTYPES: Dict[type, np.dtype] = {
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+}
+
+# Arrow types for the Python types pyodbc reports as cursor.description type_code
+# (Decimal is handled separately since it needs the column's precision and scale)
+_ARROW_TYPES: Dict[type, pa.DataType] = {
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    str: pa.string(),
+    bytes: pa.binary(),
+    bytearray: pa.binary(),
+    datetime.datetime: pa.timestamp('us'),
+    datetime.date: pa.date32(),
+    datetime.time: pa.time64('us'),
+    datetime.timedelta: pa.duration('us'),
+}
+
+# Python types mysql-connector returns for each MySQL column type, so MySQL's
+# integer type codes can use the same lookups as pyodbc's Python type codes
+_MYSQL_PYTHON_TYPES: Dict[int, type] = {
+    FieldType.TINY: int,
+    FieldType.SHORT: int,
+    FieldType.INT24: int,
+    FieldType.LONG: int,
+    FieldType.LONGLONG: int,
+    FieldType.YEAR: int,
+    FieldType.FLOAT: float,
+    FieldType.DOUBLE: float,
+    FieldType.DECIMAL: decimal.Decimal,
+    FieldType.NEWDECIMAL: decimal.Decimal,
+    FieldType.DATETIME: datetime.datetime,
+    FieldType.TIMESTAMP: datetime.datetime,
+    FieldType.DATE: datetime.date,
+    FieldType.NEWDATE: datetime.date,
+    FieldType.TIME: datetime.timedelta,
+    FieldType.VARCHAR: str,
+    FieldType.VAR_STRING: str,
+    FieldType.STRING: str,
+    FieldType.TINY_BLOB: str,
+    FieldType.MEDIUM_BLOB: str,
+    FieldType.LONG_BLOB: str,
+    FieldType.BLOB: str,
+}
+
+# Values encoded per column chunk step; small enough to stay cache resident
+_WRITE_BATCH_SIZE: int = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_arrow_threads() -> None:
+    """
+    Size Arrow's CPU and I/O thread pools to this machine, once per process.
+
+    Arrow may detect fewer cores than are usable (e.g. in containers), which
+    would leave its multithreaded conversions and reads underused.
+    """
+    cpu_count: int = os.cpu_count() or 1
+    pa.set_cpu_count(cpu_count)
+    pa.set_io_thread_count(min(8, cpu_count))
+
+
+def _write_options(compression: str = _COMPRESSION, use_dictionary: bool = True) -> Dict[str, Any]:
+    """Return this module's Parquet encoding settings as writer keyword arguments."""
+    return {
+        'compression': compression,
+        # Only ZSTD gets an explicit level; codecs such as snappy reject one
+        'compression_level': _ZSTD_LEVEL if compression == 'zstd' else None,
+        'use_dictionary': use_dictionary,
+        'data_page_version': '2.0',
+        'write_batch_size': _WRITE_BATCH_SIZE,
+    }
+
+
+def _open_writer(
+    file_path: str,
+    schema: pa.Schema,
+    compression: str = _COMPRESSION,
+    use_dictionary: bool = True
+) -> pq.ParquetWriter:
+    """Open a Parquet writer with this module's encoding settings."""
+    return pq.ParquetWriter(file_path, schema, **_write_options(compression, use_dictionary))
+
+
+def _type_code(desc: Sequence[Any]) -> Any:
+    """
+    Return a cursor.description entry's type code as the Python type of its values.
+
+    pyodbc already reports Python types. mysql-connector reports FieldType
+    integers, which are translated; binary strings (the column may hold
+    bytes or a binary-collated str) and unsigned BIGINTs (which can exceed
+    int64) map to None so their type is inferred from the data instead.
+
+    Args:
+        desc: One cursor.description entry
+
+    Returns:
+        Python type, the driver's own type code if it is not recognized, or None
+    """
+    type_code = desc[1] if len(desc) > 1 else None
+    if isinstance(type_code, type) or not isinstance(type_code, int):
+        return type_code
+
+    python_type = _MYSQL_PYTHON_TYPES.get(type_code)
+    flags: int = (desc[7] or 0) if len(desc) > 7 else 0
+    if python_type is str and flags & FieldFlag.BINARY:
+        return None
+    if type_code == FieldType.LONGLONG and flags & FieldFlag.UNSIGNED:
+        return None
+    return python_type
+
+
+def _column_to_arrow(
+    values: Sequence[Any],
+    type_code: Any,
+    arrow_type: Optional[pa.DataType] = None
+) -> pa.Array:
+    """
+    Convert one column of fetched values to an Arrow array.
+
+    Columns whose DB-API type_code is a numeric or datetime Python type (as
+    pyodbc reports them) go through a typed numpy array first, so Arrow takes
+    its bulk numpy path instead of unboxing each Python object. Columns with
+    NULLs, other types, or values numpy rejects use pa.array directly.
+
+    Args:
+        values: Column values
+        type_code: cursor.description type_code for the column
+        arrow_type: Arrow type to produce; inferred when None
+
+    Returns:
+        Arrow array for the column
+    """
+    dtype = _NUMPY_DTYPES.get(type_code) if isinstance(type_code, type) else None
+    if dtype is not None and None not in values:
+        try:
+            return pa.array(np.asarray(values, dtype=dtype), type=arrow_type)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return pa.array(values, type=arrow_type)
+
+
+def _rows_to_matrix_arrays(
+    rows: Sequence[Sequence[Any]],
+    dtype: np.dtype,
+    arrow_types: Sequence[Optional[pa.DataType]]
+) -> Optional[List[pa.Array]]:
+    """
+    Convert rows whose columns all share one numeric dtype in a single C-level pass.
+
+    np.array() unboxes the row tuples straight into a 2-D buffer, skipping
+    the zip(*rows) transpose and the per-column conversions; for all-integer
+    or all-float results this is several times faster than the general path.
+
+    Args:
+        rows: Non-empty batch of row tuples
+        dtype: numpy dtype shared by every column
+        arrow_types: Arrow type of each column; inferred where None
+
+    Returns:
+        One Arrow array per column, or None if the batch has NULLs or values
+        the dtype cannot hold (the caller then converts column by column)
+    """
+    try:
+        matrix = np.array(rows, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if matrix.ndim != 2 or (dtype.kind == 'f' and np.isnan(matrix).any()):
+        return None
+    return [
+        pa.array(column, type=arrow_type)
+        for column, arrow_type in zip(np.ascontiguousarray(matrix.T), arrow_types)
+    ]
+
+
+def _described_types(description: Sequence[Sequence[Any]]) -> List[Optional[pa.DataType]]:
+    """
+    Derive each result column's Arrow type from cursor.description.
+
+    Type codes are the Python types pyodbc reports (int, str, Decimal,
+    datetime, ...) or mysql-connector FieldType codes. DECIMAL columns take
+    their precision and scale from the description; mysql-connector leaves
+    the precision unset, so a known scale alone gives decimal128(38, scale),
+    which holds any value of that scale.
+
+    Args:
+        description: DB-API cursor.description
+
+    Returns:
+        Arrow type per column, None where the type has to come from the data
+    """
+    types: List[Optional[pa.DataType]] = []
+    for desc in description:
+        type_code = _type_code(desc)
+        if type_code is decimal.Decimal:
+            precision, scale = (desc[4], desc[5]) if len(desc) > 5 else (None, None)
+            if precision and 0 < precision <= 38:
+                types.append(pa.decimal128(precision, scale or 0))
+            elif scale is not None and 0 <= scale <= 38:
+                types.append(pa.decimal128(38, scale))
+            else:
+                types.append(None)
+        else:
+            types.append(_ARROW_TYPES.get(type_code) if isinstance(type_code, type) else None)
+    return types
+
+
+def schema_from_description(description: Sequence[Sequence[Any]]) -> Optional[pa.Schema]:
+    """
+    Derive the Arrow schema of a result set from cursor.description.
+
+    Args:
+        description: DB-API cursor.description
+
+    Returns:
+        Arrow schema, or None if any column's type has to come from the data
+    """
+    types: List[Optional[pa.DataType]] = _described_types(description)
+    if any(arrow_type is None for arrow_type in types):
+        return None
+    return pa.schema([
+        pa.field(desc[0], arrow_type) for desc, arrow_type in zip(description, types)
+    ])
+
+
+def _resolve_types(types: List[Optional[pa.DataType]], arrays: Sequence[pa.Array]) -> bool:
+    """
+    Fill in still unknown column types, in place, from one batch's inferred arrays.
+
+    A column that is all NULL in the batch stays unknown until a later batch
+    holds a value. Inferred decimals are widened to precision 38, since the
+    first batch's values say nothing about how many digits later ones have.
+
+    Args:
+        types: Arrow type per column, None where not yet known
+        arrays: The batch's arrays, one per column
+
+    Returns:
+        True once every column has a type
+    """
+    for i, array in enumerate(arrays):
+        if types[i] is None and not pa.types.is_null(array.type):
+            inferred: pa.DataType = array.type
+            if pa.types.is_decimal128(inferred):
+                inferred = pa.decimal128(38, inferred.scale)
+            types[i] = inferred
+    return all(arrow_type is not None for arrow_type in types)
+
+
+def _final_schema(names: Sequence[str], types: Sequence[Optional[pa.DataType]]) -> pa.Schema:
+    """Build a stream's schema; columns that never held a value stay null-typed."""
+    return pa.schema([
+        pa.field(name, arrow_type if arrow_type is not None else pa.null())
+        for name, arrow_type in zip(names, types)
+    ])
+
+
+def _to_batch(arrays: Sequence[pa.Array], schema: pa.Schema) -> pa.RecordBatch:
+    """Assemble arrays into a record batch, casting those inferred as another type."""
+    return pa.RecordBatch.from_arrays(
+        [
+            array if array.type == field.type else array.cast(field.type)
+            for array, field in zip(arrays, schema)
+        ],
+        schema=schema
+    )
+
+
+def iter_record_batches(
+    cursor: Any,
+    batch_size: int,
+    schema: Optional[pa.Schema] = None
+) -> Iterator[Tuple[List[Any], pa.RecordBatch]]:
+    """
+    Fetch an executed DB-API cursor in fetchmany batches and convert each to Arrow.
+
+    Every yielded batch has the same schema. Column types come from the
+    given schema or cursor.description; columns the description cannot
+    type are resolved one at a time from the data. While such a column has
+    only held NULLs, batches are held back (not yielded) until one carries a
+    value, so a Parquet writer opened on the first yielded batch never has
+    to change type. Columns that stay NULL to the end are null-typed.
+
+    Args:
+        cursor: DB-API cursor with an executed query
+        batch_size: Number of rows fetched per batch
+        schema: Arrow schema to enforce; derived from cursor.description when None
+
+    Yields:
+        Tuples of (raw rows, matching Arrow record batch)
+    """
+    column_names: List[str] = [desc[0] for desc in cursor.description]
+    type_codes: List[Any] = [_type_code(desc) for desc in cursor.description]
+    types: List[Optional[pa.DataType]] = (
+        list(schema.types) if schema is not None else _described_types(cursor.description)
+    )
+    resolved: Optional[pa.Schema] = (
+        _final_schema(column_names, types) if all(t is not None for t in types) else None
+    )
+    # Batches fetched before every column's type is known
+    held: List[Tuple[List[Any], List[pa.Array]]] = []
+
+    # All-integer or all-float results are converted as one numpy matrix per batch
+    matrix_dtype: Optional[np.dtype] = None
+    if len(set(type_codes)) == 1 and isinstance(type_codes[0], type):
+        matrix_dtype = _MATRIX_DTYPES.get(type_codes[0])
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+
+        arrays = None
+        if matrix_dtype is not None:
+            arrays = _rows_to_matrix_arrays(rows, matrix_dtype, types)
+        if arrays is None:
+            # Transpose the row tuples into columns for Arrow
+            arrays = [
+                _column_to_arrow(column, code, arrow_type)
+                for column, code, arrow_type in zip(zip(*rows), type_codes, types)
+            ]
+
+        if resolved is not None:
+            yield rows, _to_batch(arrays, resolved)
+            continue
+        held.append((rows, arrays))
+        if _resolve_types(types, arrays):
+            resolved = _final_schema(column_names, types)
+            for held_rows, held_arrays in held:
+                yield held_rows, _to_batch(held_arrays, resolved)
+            held = []
+
+    if held:
+        resolved = _final_schema(column_names, types)
+        for held_rows, held_arrays in held:
+            yield held_rows, _to_batch(held_arrays, resolved)
+
 
 class ParquetWriter:
+    """
+    Writes query results to Parquet files.
+
+    The write_*_to_parquet methods are self-contained and each produce one
+    complete file. For appending many chunks to a single file, use the
+    open()/write_batch()/close() API, or the instance as a context manager:
+
+        with ParquetWriter().open('users.parquet') as writer:
+            for chunk in chunks:
+                writer.write_batch(chunk)
+    """
+
     def __init__(self) -> None:
-        pass
-    
-    def write_to_parquet(self, data: List[Dict[str, Any]], file_path: str) -> None:
+        _configure_arrow_threads()
+
+        # State for the incremental open()/write_batch()/close() API
+        self._file_path: Optional[str] = None
+        self._schema: Optional[pa.Schema] = None
+        self._write_kwargs: Dict[str, Any] = {}
+        self._writer: Optional[pq.ParquetWriter] = None
+        # Column names and types of the open file, and batches held back
+        # until every column's type is known
+        self._names: Optional[List[str]] = None
+        self._types: Optional[List[Optional[pa.DataType]]] = None
+        self._held: List[List[pa.Array]] = []
+        self.rows_written: int = 0
+
+    def open(
+        self,
+        file_path: str,
+        schema: Optional[pa.Schema] = None,
+        compression: str = _COMPRESSION,
+        use_dictionary: bool = True
+    ) -> 'ParquetWriter':
+        """
+        Start an incremental write to file_path.
+
+        Without a schema, each column's type is inferred from the first batch
+        that holds a value for it (inferred decimals are widened to precision
+        38). The file is created once every column has a type; batches before
+        that are held in memory, and a column that is NULL until close() is
+        written null-typed.
+
+        Args:
+            file_path: Destination Parquet file path
+            schema: Arrow schema to enforce, whose names also label tuple rows;
+                inferred from the data when None
+            compression: Parquet codec, e.g. 'zstd' (level 1), 'snappy' or 'none'
+            use_dictionary: Whether to dictionary-encode columns
+
+        Returns:
+            This writer, for use in a with statement
+
+        Raises:
+            RuntimeError: If an incremental write is already in progress
+        """
+        if self._file_path is not None:
+            raise RuntimeError(f"ParquetWriter is already open for {self._file_path}")
+        self._file_path = file_path
+        self._schema = schema
+        self._write_kwargs = {'compression': compression, 'use_dictionary': use_dictionary}
+        self.rows_written = 0
+        return self
+
+    def write_batch(self, rows: Sequence[Row]) -> None:
+        """
+        Append rows to the open file as one record batch.
+
+        Args:
+            rows: Rows as dictionaries (column name keys) or tuples; empty is a no-op
+
+        Raises:
+            RuntimeError: If open() has not been called
+        """
+        if self._file_path is None:
+            raise RuntimeError("ParquetWriter.open() must be called before write_batch()")
+        if not rows:
+            return
+
+        names = self._schema.names if self._schema is not None else None
+        self._write_columns(self._to_columns(rows, names))
+        self.rows_written += len(rows)
+
+    def _write_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """
+        Append one non-empty batch of columns, resolving the file schema first.
+
+        Args:
+            columns: Column name -> values; every column of the file must be present
+        """
+        if self._types is None:
+            if self._schema is not None:
+                self._names, self._types = list(self._schema.names), list(self._schema.types)
+            else:
+                self._names, self._types = list(columns), [None] * len(columns)
+        arrays = [
+            pa.array(columns[name], type=arrow_type)
+            for name, arrow_type in zip(self._names, self._types)
+        ]
+
+        if self._writer is not None:
+            self._write_arrays(arrays)
+            return
+        self._held.append(arrays)
+        if _resolve_types(self._types, arrays):
+            self._open_file()
+
+    def _open_file(self) -> None:
+        """Create the Parquet file on the resolved schema and write the held batches."""
+        self._writer = _open_writer(
+            self._file_path, _final_schema(self._names, self._types), **self._write_kwargs
+        )
+        held, self._held = self._held, []
+        for arrays in held:
+            self._write_arrays(arrays)
+
+    def _write_arrays(self, arrays: Sequence[pa.Array]) -> None:
+        """Write one batch's arrays to the open file as a single row group."""
+        batch = _to_batch(arrays, self._writer.schema)
+        self._writer.write_batch(batch, row_group_size=batch.num_rows)
+
+    def close(self) -> None:
+        """Finish the incremental write, writing the Parquet footer if any rows were written."""
+        try:
+            if self._writer is None and self._held:
+                self._open_file()
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._writer = None
+            self._file_path = None
+            self._schema = None
+            self._write_kwargs = {}
+            self._names = None
+            self._types = None
+            self._held = []
+
+    def __enter__(self) -> 'ParquetWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _to_columns(
+        data: Sequence[Row],
+        names: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Transpose row-oriented data into a column name -> values dictionary.
+
+        Column names come from the first row's keys for mapping rows. Positional
+        rows (tuples) are labelled by names, or get the names "0", "1", ... like
+        a pandas DataFrame would.
+
+        Args:
+            data: Non-empty sequence of rows
+            names: Column names for positional rows, in order
+
+        Returns:
+            Dictionary of column name to list of values
+
+        Raises:
+            ValueError: If positional rows are not as wide as names
+        """
+        first = data[0]
+        if isinstance(first, Mapping):
+            names: List[str] = list(first)
+            if not names:
+                return {}
+            if len(names) == 1:
+                return {names[0]: [row.get(names[0]) for row in data]}
+            try:
+                # One C-level key lookup per row, then a single transpose
+                values = zip(*map(itemgetter(*names), data))
+                return dict(zip(names, map(list, values)))
+            except KeyError:
+                # Ragged rows: missing keys become nulls
+                return {column: [row.get(column) for row in data] for column in names}
+        columns = [list(column) for column in zip(*data)]
+        if names is None:
+            return {str(i): column for i, column in enumerate(columns)}
+        if len(columns) != len(names):
+            raise ValueError(f"Rows have {len(columns)} columns, the schema has {len(names)}")
+        return dict(zip(names, columns))
+
+    def write_to_parquet(
+        self,
+        data: Sequence[Row],
+        file_path: str,
+        compression: str = _COMPRESSION,
+        row_group_size: int = _ROW_GROUP_SIZE,
+        use_dictionary: bool = True
+    ) -> None:
+        """
+        Write rows to a Parquet file through a columnar Arrow table.
+
+        Args:
+            data: Rows as dictionaries (column name keys) or tuples
+            file_path: Destination Parquet file path
+            compression: Parquet codec, e.g. 'zstd' (level 1), 'snappy' or 'none'
+            row_group_size: Maximum rows per row group
+            use_dictionary: Dictionary-encode columns
+
+        Raises:
+            ValueError: If data is empty
+        """
         # Check if data is not empty
         if not data:
             raise ValueError("Data cannot be empty.")
-        
-        # Convert the data to a DataFrame (column names come from dict keys)
-        df: pd.DataFrame = pd.DataFrame(data)
-        
-        # Write the DataFrame to a Parquet file
-        df.to_parquet(file_path, index=False)
\ No newline at end of file
+
+        # Build the Arrow table column by column, without a DataFrame in between
+        table: pa.Table = pa.Table.from_pydict(self._to_columns(data))
+        self.write_table_to_parquet(table, file_path, compression, row_group_size, use_dictionary)
+
+    def write_columns_to_parquet(
+        self,
+        column_names: Sequence[str],
+        columns: Sequence[Sequence[Any]],
+        file_path: str,
+        compression: str = _COMPRESSION,
+        row_group_size: int = _ROW_GROUP_SIZE,
+        use_dictionary: bool = True
+    ) -> None:
+        """
+        Write column-oriented data (e.g. from QueryExecutor.execute_query_columnar) to Parquet.
+
+        Args:
+            column_names: Name of each column
+            columns: One sequence of values per column, in column_names order
+            file_path: Destination Parquet file path
+            compression: Parquet codec, e.g. 'zstd' (level 1), 'snappy' or 'none'
+            row_group_size: Maximum rows per row group
+            use_dictionary: Dictionary-encode columns
+
+        Raises:
+            ValueError: If there are no rows
+        """
+        if not columns or not len(columns[0]):
+            raise ValueError("Data cannot be empty.")
+
+        table: pa.Table = pa.Table.from_arrays(
+            [pa.array(column) for column in columns], names=list(column_names)
+        )
+        self.write_table_to_parquet(table, file_path, compression, row_group_size, use_dictionary)
+
+    def write_table_to_parquet(
+        self,
+        table: pa.Table,
+        file_path: str,
+        compression: str = _COMPRESSION,
+        row_group_size: int = _ROW_GROUP_SIZE,
+        use_dictionary: bool = True
+    ) -> None:
+        """
+        Write an already columnar Arrow table to a Parquet file.
+
+        Use this for results fetched as columns (e.g. QueryExecutor.execute_to_arrow)
+        so no row-oriented copy is made.
+
+        Args:
+            table: Arrow table to write
+            file_path: Destination Parquet file path
+            compression: Parquet codec, e.g. 'zstd' (level 1), 'snappy' or 'none'
+            row_group_size: Maximum rows per row group
+            use_dictionary: Dictionary-encode columns
+        """
+        pq.write_table(
+            table,
+            file_path,
+            row_group_size=row_group_size,
+            **_write_options(compression, use_dictionary)
+        )
+
+    def write_batches_to_parquet(self, batches: Iterable[Sequence[Row]], file_path: str) -> int:
+        """
+        Stream chunks of rows into a single Parquet file, one record batch per chunk.
+
+        Only one chunk is held in memory at a time, except while a column has
+        only held NULLs: its type is taken from the first chunk with a value,
+        and the chunks before it are held until then (see open()).
+
+        Args:
+            batches: Iterable of row chunks (dictionaries or tuples)
+            file_path: Destination Parquet file path
+
+        Returns:
+            Total number of rows written
+
+        Raises:
+            ValueError: If no chunk contains any rows
+        """
+        # A separate instance keeps this call independent of any open() in progress
+        with ParquetWriter().open(file_path) as writer:
+            for chunk in batches:
+                writer.write_batch(chunk)
+            row_count: int = writer.rows_written
+
+        if not row_count:
+            raise ValueError("Data cannot be empty.")
+        return row_count
+
+    def write_stream(
+        self,
+        batches: Iterable[Mapping[str, Sequence[Any]]],
+        file_path: str,
+        schema: Optional[pa.Schema] = None,
+        compression: str = _COMPRESSION
+    ) -> int:
+        """
+        Stream column-oriented batches into a Parquet file, one row group per batch.
+
+        Pair with QueryExecutor.iter_query_columns so each fetchmany batch is
+        encoded and compressed while the next one is read; peak memory is one
+        batch rather than the whole result. Without a schema, column types
+        are resolved like open() does, so a column NULL in the first batches
+        takes its type from the first batch holding a value.
+
+        Args:
+            batches: Iterable of column name -> values mappings
+            file_path: Destination Parquet file path
+            schema: Arrow schema to enforce; inferred from the data when None
+            compression: Parquet codec, e.g. 'zstd' (level 1), 'snappy' or 'none'
+
+        Returns:
+            Total number of rows written. No file is written when there are no rows.
+        """
+        # A separate instance keeps this call independent of any open() in progress
+        with ParquetWriter().open(file_path, schema, compression) as writer:
+            for columns in batches:
+                num_rows: int = len(next(iter(columns.values()), ()))
+                if not num_rows:
+                    continue
+                writer._write_columns(columns)
+                writer.rows_written += num_rows
+            row_count: int = writer.rows_written
+
+        return row_count
+
+    def write_cursor_to_parquet(
+        self,
+        cursor: Any,
+        file_path: str,
+        batch_size: int = 10_000,
+        schema: Optional[pa.Schema] = None
+    ) -> int:
+        """
+        Stream an executed DB-API cursor into a Parquet file without fetchall().
+
+        Rows are pulled with cursor.fetchmany(batch_size) and written as one
+        record batch each, so memory is bounded by a single batch.
+
+        Args:
+            cursor: DB-API cursor with an executed query
+            file_path: Destination Parquet file path
+            batch_size: Number of rows fetched and written per batch
+            schema: Arrow schema to enforce; derived from cursor.description when None
+
+        Returns:
+            Total number of rows written. No file is written when there are no rows.
+        """
+        writer: Optional[pq.ParquetWriter] = None
+        row_count: int = 0
+        try:
+            for rows, batch in iter_record_batches(cursor, batch_size, schema):
+                if writer is None:
+                    writer = _open_writer(file_path, batch.schema)
+                writer.write_batch(batch)
+                row_count += len(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return row_count
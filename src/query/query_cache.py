@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Sequence
+import hashlib
+import re
+import threading
+
+
+# Quoted strings and identifiers, the same in MySQL and SQL Server as long as
+# no backslash escapes are involved; captured so re.split() keeps them
+_QUOTED_RE = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`(?:[^`]|``)*`)")
+_WHITESPACE_RE = re.compile(r'\s+')
+# Backslash escapes (MySQL only), comments and [bracketed] identifiers (SQL
+# Server only) can hide where quotes start and end, and with that which
+# whitespace is inside a literal
+_AMBIGUOUS_MARKERS = ('\\', '#', '--', '/*', '[')
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Collapse whitespace runs outside quoted strings and identifiers.
+
+    Queries containing any of _AMBIGUOUS_MARKERS are only stripped, as
+    collapsing whitespace there could merge queries that differ inside a
+    literal ('a  b' is not 'a b').
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Query text for the cache key
+    """
+    if any(marker in query for marker in _AMBIGUOUS_MARKERS):
+        return query.strip()
+    # Even indices are unquoted text, odd indices the quoted tokens between them
+    parts: List[str] = _QUOTED_RE.split(query)
+    parts[::2] = [_WHITESPACE_RE.sub(' ', part) for part in parts[::2]]
+    return ''.join(parts).strip()
+
+
+class QueryResultCache:
+    """
+    Least-recently-used cache of query results, keyed on the normalized query text.
+
+    Pass an instance to QueryExecutor to skip re-executing identical SELECTs,
+    e.g. repeated exports of the same report. Entries are never invalidated
+    by writes to the database; call clear() when the underlying data changes.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of result sets kept before the least recently used is evicted
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Invalid cache size: {maxsize}")
+        self.maxsize: int = maxsize
+        self._entries: 'OrderedDict[bytes, List[Dict[str, Any]]]' = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def key_for(query: str, params: Optional[Sequence[Any]] = None) -> bytes:
+        """
+        Hash a query and its bind parameters into a cache key.
+
+        Whitespace runs outside quotes are collapsed first, so reformatting a
+        query does not defeat the cache. Case is kept because string literals
+        are case-sensitive.
+
+        Args:
+            query: SQL query string
+            params: Bind parameters, part of the key when given
+
+        Returns:
+            16-byte BLAKE2b digest of the normalized query
+        """
+        normalized: str = _normalize_query(query)
+        digest = hashlib.blake2b(normalized.encode(), digest_size=16)
+        if params is not None:
+            digest.update(b'\0' + repr(tuple(params)).encode())
+        return digest.digest()
+
+    def get(self, query: str, params: Optional[Sequence[Any]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up the cached result of a query.
+
+        Args:
+            query: SQL query string
+            params: Bind parameters the query was executed with
+
+        Returns:
+            Copies of the cached row dictionaries, or None on a miss; callers
+            may mutate them without affecting later hits
+        """
+        key: bytes = self.key_for(query, params)
+        with self._lock:
+            rows = self._entries.get(key)
+            if rows is None:
+                return None
+            self._entries.move_to_end(key)
+            return [dict(row) for row in rows]
+
+    def put(self, query: str, rows: List[Dict[str, Any]], params: Optional[Sequence[Any]] = None) -> None:
+        """
+        Store the result of a query, evicting the least recently used entry when full.
+        
+        Each row is copied, so the caller that produced the rows can keep
+        mutating them without corrupting the cache.
+
+        Args:
+            query: SQL query string
+            rows: Result rows as dictionaries
+            params: Bind parameters the query was executed with
+        """
+        key: bytes = self.key_for(query, params)
+        with self._lock:
+            self._entries[key] = [dict(row) for row in rows]
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
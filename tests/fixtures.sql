@@ -0,0 +1,49 @@
+-- Schema and fixture rows for tests/test_query_executor_realDB.py.
+--
+-- Mount into a MySQL container so the server loads them at first boot:
+--   docker run --name test-mysql -e MYSQL_ROOT_PASSWORD=password \
+--     -e MYSQL_DATABASE=testdb -e MYSQL_USER=testuser -e MYSQL_PASSWORD=testpass \
+--     -v "$PWD/tests/fixtures.sql:/docker-entrypoint-initdb.d/fixtures.sql:ro" \
+--     -p 3306:3306 -d mysql:8.0
+-- then run the tests with UPE_REALDB_PRELOADED=1 to skip the Python-side setup.
+-- Keep the rows in sync with _USERS and _ORDERS in the test module.
+
+CREATE DATABASE IF NOT EXISTS testdb;
+USE testdb;
+
+CREATE TABLE IF NOT EXISTS users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE,
+    age INT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT,
+    product_name VARCHAR(100) NOT NULL,
+    quantity INT NOT NULL,
+    price DECIMAL(10, 2) NOT NULL,
+    order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+INSERT INTO users (name, email, age) VALUES
+('John Doe', 'john.doe@example.com', 30),
+('Jane Smith', 'jane.smith@example.com', 25),
+('Bob Johnson', 'bob.johnson@example.com', 35),
+('Alice Brown', 'alice.brown@example.com', 28),
+('Charlie Wilson', 'charlie.wilson@example.com', 32),
+('Test User & Co.', 'test+special@example.com', 30),
+('Test User NULL', 'test_null@example.com', NULL);
+
+INSERT INTO orders (user_id, product_name, quantity, price) VALUES
+(1, 'Laptop', 1, 999.99),
+(1, 'Mouse', 2, 25.50),
+(2, 'Keyboard', 1, 75.00),
+(2, 'Monitor', 1, 299.99),
+(3, 'Tablet', 1, 499.99),
+(4, 'Headphones', 1, 199.99),
+(4, 'Webcam', 1, 89.99),
+(5, 'Smartphone', 1, 699.99);
@@ -4,14 +4,34 @@ Standalone OpenSSL Patch Test
 Tests if the OpenSSL patch can be applied and if it affects pyodbc behavior
 """
 
+import atexit
+import functools
 import os
 import sys
 import tempfile
 import pyodbc
 
-def create_openssl_patch():
-    """Create OpenSSL legacy config"""
-    config_content = """openssl_conf = openssl_init
+_BASE_CONN_STR = (
+    f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+    f"SERVER=192.168.210.21;"
+    f"DATABASE=stss;"
+    f"UID=spm;"
+    f"PWD=spm;"
+    f"Encrypt=no;"
+    f"TrustServerCertificate=yes;"
+)
+
+# Connection string approaches, tried in order until one connects
+_APPROACHES = (
+    ("minimal connection string", _BASE_CONN_STR),
+    ("ODBC Driver 18", _BASE_CONN_STR.replace("ODBC Driver 17", "ODBC Driver 18")),
+    ("without database specification", _BASE_CONN_STR.replace("DATABASE=stss;", "")),
+)
+
+# The first connection that worked, shared by every probe in this process
+_connection = None
+
+_OPENSSL_PATCH_CONFIG = """openssl_conf = openssl_init
 
 [openssl_init]
 ssl_conf = ssl_sect
@@ -22,15 +42,46 @@ system_default = system_default_sect
 [system_default_sect]
 CipherString = DEFAULT:@SECLEVEL=0
 """
-    
+
+def _remove_patch_file(path):
+    """Delete the patch file at interpreter exit if it is still there"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+@functools.lru_cache(maxsize=1)
+def create_openssl_patch():
+    """Create OpenSSL legacy config once per process and return its path"""
     temp_dir = tempfile.gettempdir()
     config_path = os.path.join(temp_dir, f"test_openssl_patch_{os.getpid()}.cnf")
     
     with open(config_path, 'w') as f:
-        f.write(config_content)
+        f.write(_OPENSSL_PATCH_CONFIG)
     
+    atexit.register(_remove_patch_file, config_path)
     return config_path
 
+def _connect_once():
+    """Open the first connection approach that works and reuse it afterwards"""
+    global _connection
+    if _connection is not None:
+        return _connection
+    
+    for number, (description, conn_str) in enumerate(_APPROACHES, 1):
+        print(f"\\n{number}. Testing with {description}...")
+        try:
+            _connection = pyodbc.connect(conn_str)
+        except Exception as e:
+            print(f"❌ Failed: {e}")
+            continue
+        
+        print(f"✅ SUCCESS with {description}!")
+        atexit.register(_connection.close)
+        return _connection
+    
+    return None
+
 def test_connection_with_patch():
     """Test connection with OpenSSL patch"""
     
@@ -53,66 +104,19 @@ def test_connection_with_patch():
         os.environ['OPENSSL_CONF'] = patch_file
         print(f"Applied OPENSSL_CONF: {os.environ['OPENSSL_CONF']}")
         
-        # Test connection with different connection string approaches
-        
-        # Approach 1: Minimal connection string
-        print("\\n1. Testing with minimal connection string...")
-        conn_str1 = (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-            f"SERVER=192.168.210.21;"
-            f"DATABASE=stss;"
-            f"UID=spm;"
-            f"PWD=spm;"
-            f"Encrypt=no;"
-            f"TrustServerCertificate=yes;"
-        )
+        # Test connection with different connection string approaches; the
+        # connection that works is kept open for the diagnostic query below
+        conn = _connect_once()
+        if conn is None:
+            return False
         
-        try:
-            conn = pyodbc.connect(conn_str1)
-            print("✅ SUCCESS with minimal connection string!")
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-        
-        # Approach 2: Try with different drivers
-        print("\\n2. Testing with ODBC Driver 18...")
-        conn_str2 = conn_str1.replace("ODBC Driver 17", "ODBC Driver 18")
-        
-        try:
-            conn = pyodbc.connect(conn_str2)
-            print("✅ SUCCESS with ODBC Driver 18!")
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-            
-        # Approach 3: Try without database specification
-        print("\\n3. Testing without database specification...")
-        conn_str3 = (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-            f"SERVER=192.168.210.21;"
-            f"UID=spm;"
-            f"PWD=spm;"
-            f"Encrypt=no;"
-            f"TrustServerCertificate=yes;"
-        )
-        
-        try:
-            conn = pyodbc.connect(conn_str3)
-            print("✅ SUCCESS without database specification!")
-            # Try to select current database
-            cursor = conn.cursor()
-            cursor.execute("SELECT DB_NAME()")
-            db_name = cursor.fetchone()[0]
-            print(f"Connected to database: {db_name}")
-            cursor.close()
-            conn.close()
-            return True
-        except Exception as e:
-            print(f"❌ Failed: {e}")
-        
-        return False
+        # Try to select current database
+        cursor = conn.cursor()
+        cursor.execute("SELECT DB_NAME()")
+        db_name = cursor.fetchone()[0]
+        print(f"Connected to database: {db_name}")
+        cursor.close()
+        return True
             
     finally:
         # Restore original setting
@@ -120,14 +124,9 @@ def test_connection_with_patch():
             os.environ['OPENSSL_CONF'] = old_conf
         elif 'OPENSSL_CONF' in os.environ:
             del os.environ['OPENSSL_CONF']
-            
-        # Clean up patch file
-        try:
-            os.remove(patch_file)
-        except:
-            pass
         
-        print(f"\\nCleaned up and restored OPENSSL_CONF")
+        # The patch file itself is reused and removed at exit
+        print(f"\\nRestored OPENSSL_CONF")
 
 if __name__ == "__main__":
     success = test_connection_with_patch()
@@ -8,17 +8,24 @@ This script mirrors connectionTest.ipynb functionality with enhanced diagnostics
 and troubleshooting for SQL Server connections on macOS.
 """
 
+import functools
 import os
 import sys
 import traceback
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.database.sqlserver_connection import SQLServerConnection
+from src.database.sqlserver_connection import SQLServerConnection, _all_drivers
 from config.sqlserver_config import SQLServerConfig
 
+@functools.lru_cache(maxsize=1)
+def _sql_drivers() -> tuple:
+    """SQL Server ODBC drivers, read through the same process-wide cache SQLServerConnection uses"""
+    return tuple(driver for driver in _all_drivers() if 'SQL Server' in driver)
+
 def load_config_from_env() -> SQLServerConfig:
     """Load configuration from .confSQLConnection environment variables"""
     
@@ -95,9 +102,7 @@ def test_prerequisites():
     
     # List available ODBC drivers
     try:
-        import pyodbc
-        all_drivers = pyodbc.drivers()
-        sql_drivers = [driver for driver in all_drivers if 'SQL Server' in driver]
+        sql_drivers = _sql_drivers()
         
         if sql_drivers:
             print(f"✅ Available SQL Server ODBC drivers:")
@@ -144,8 +149,8 @@ def test_connection_prerequisites(config: SQLServerConfig):
     
     return prereq_results['config_valid']
 
-def test_connection_with_patch_modes(config: SQLServerConfig):
-    """Test connection with different OpenSSL patch modes"""
+def test_connection_with_patch_modes(config: SQLServerConfig) -> Optional[SQLServerConnection]:
+    """Test connection with different OpenSSL patch modes, returning the open connection that worked"""
     print("\n🧪 Testing Connection with OpenSSL Patch Modes...")
     
     # Test 1: Without patch (if auto-patch is enabled, create config with it disabled)
@@ -169,8 +174,7 @@ def test_connection_with_patch_modes(config: SQLServerConfig):
         print("🔄 Attempting connection without OpenSSL patch...")
         conn = sql_conn_no_patch.connect()
         print("✅ Connection successful without patch")
-        sql_conn_no_patch.close()
-        return True  # No patch needed
+        return sql_conn_no_patch  # No patch needed
     except Exception as e:
         print(f"❌ Connection failed without patch: {str(e)[:100]}...")
     
@@ -195,19 +199,19 @@ def test_connection_with_patch_modes(config: SQLServerConfig):
         print("🔄 Attempting connection with automatic OpenSSL patch...")
         conn = sql_conn_patch.connect()
         print("✅ Connection successful with OpenSSL patch!")
-        sql_conn_patch.close()
-        return True
+        return sql_conn_patch
     except Exception as e:
         print(f"❌ Connection failed even with patch: {str(e)[:100]}...")
     
-    return False
+    return None
 
-def test_connection(config: SQLServerConfig):
-    """Test SQL Server connection with detailed diagnostics"""
+def test_connection(config: SQLServerConfig, sql_conn: Optional[SQLServerConnection] = None):
+    """Test SQL Server connection with detailed diagnostics, reusing sql_conn when already open"""
     print(f"\n🔌 Testing Connection to {config.host}:{config.port}...")
     
-    # Create connection object
-    sql_conn = SQLServerConnection(config)
+    # Create connection object unless an open one was handed over
+    if sql_conn is None:
+        sql_conn = SQLServerConnection(config)
     
     try:
         # Build and display connection string (with masked password)
@@ -225,30 +229,34 @@ def test_connection(config: SQLServerConfig):
         print(f"   Encrypt: {config.encrypt}")
         print(f"   Trust Certificate: {config.trust_server_certificate}")
         
-        # Attempt connection
+        # Attempt connection (returns the existing one if already connected)
         print("🔄 Attempting connection...")
         connection = sql_conn.connect()
         
         if connection:
             print("✅ Connection successful!")
             
-            # Test basic query (matching user's sqlcmd test: SELECT DB_NAME())
-            print("🔄 Testing basic query...")
+            # Test basic query (matching user's sqlcmd test: SELECT DB_NAME()),
+            # server version and a sample query similar to connectionTest.ipynb,
+            # sent as one batch so they cost a single round-trip
+            print("🔄 Testing basic and sample queries...")
             cursor = connection.cursor()
             
-            cursor.execute("SELECT DB_NAME() as current_database")
+            cursor.execute(
+                "SELECT DB_NAME() as current_database;"
+                " SELECT @@VERSION as sql_version;"
+                " SELECT TOP 5 name, database_id FROM sys.databases ORDER BY name;"
+            )
             result = cursor.fetchone()
             print(f"📊 Current Database: {result[0]}")
             
             # Additional system info to verify connectivity
-            cursor.execute("SELECT @@VERSION as sql_version")
+            cursor.nextset()
             version = cursor.fetchone()[0]
             version_line = version.split('\\n')[0] if '\\n' in version else version
             print(f"🔧 SQL Server Version: {version_line}")
             
-            # Test query similar to connectionTest.ipynb
-            print("🔄 Testing sample query...")
-            cursor.execute("SELECT TOP 5 name, database_id FROM sys.databases ORDER BY name")
+            cursor.nextset()
             databases = cursor.fetchall()
             print("📋 Available databases:")
             for db in databases:
@@ -346,12 +354,12 @@ def main():
     
     # Test connection with different patch modes
     print("\n📋 Step 4: OpenSSL Patch Mode Testing")
-    success = test_connection_with_patch_modes(config)
+    sql_conn = test_connection_with_patch_modes(config)
     
-    if not success:
-        # If patch mode testing fails, try standard connection test
-        print("\n📋 Step 5: Standard Connection Test")
-        success = test_connection(config)
+    # Run the diagnostic queries on the connection that worked, or
+    # retry with the standard connection test if none did
+    print("\n📋 Step 5: Standard Connection Test")
+    success = test_connection(config, sql_conn)
     
     print("\\n" + "=" * 50)
     if success:
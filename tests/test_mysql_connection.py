@@ -45,6 +45,21 @@ class TestMySQLConnection(unittest.TestCase):
         with self.assertRaises(mysql.connector.Error):
             self.mysql_connection.connect()
     
+    @patch('src.database.mysql_connection.MySQLConnectionPool')
+    def test_create_pool(self, mock_pool_class: Mock) -> None:
+        """Test that a connection pool is created from the same config."""
+        result = self.mysql_connection.create_pool(pool_size=4)
+        
+        mock_pool_class.assert_called_once_with(
+            pool_name="upe",
+            pool_size=4,
+            host="localhost",
+            user="testuser",
+            password="testpass",
+            database="testdb"
+        )
+        self.assertEqual(result, mock_pool_class.return_value)
+    
     def test_close_with_connection(self) -> None:
         """Test closing an existing connection."""
         mock_connection: Mock = Mock(spec=MySQLConn)
@@ -1,11 +1,16 @@
 import unittest
 from unittest.mock import patch, Mock, MagicMock
-from typing import List, Tuple, Any
+from typing import List, Tuple, Dict, Any
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from mysql.connector.constants import FieldType
+import datetime
+import decimal
 import tempfile
 import os
 
-from src.export.parquet_writer import ParquetWriter
+from src.export.parquet_writer import ParquetWriter, schema_from_description
 
 
 class TestParquetWriter(unittest.TestCase):
@@ -19,21 +24,19 @@ class TestParquetWriter(unittest.TestCase):
             (3, 'Bob', 'Johnson', 35)
         ]
     
-    @patch('src.export.parquet_writer.pd.DataFrame')
-    def test_write_to_parquet_success(self, mock_dataframe: Mock) -> None:
+    @patch('src.export.parquet_writer.pq.write_table')
+    def test_write_to_parquet_success(self, mock_write_table: Mock) -> None:
         """Test successful parquet file writing."""
-        mock_df: Mock = MagicMock()
-        mock_dataframe.return_value = mock_df
-        
         file_path: str = 'test_output.parquet'
         
         self.parquet_writer.write_to_parquet(self.test_data, file_path)
         
-        # Verify DataFrame creation
-        mock_dataframe.assert_called_once_with(self.test_data)
-        
-        # Verify parquet writing
-        mock_df.to_parquet.assert_called_once_with(file_path, index=False)
+        # Verify parquet writing with the table built from the rows
+        mock_write_table.assert_called_once()
+        written: pa.Table = mock_write_table.call_args.args[0]
+        self.assertEqual(mock_write_table.call_args.args[1], file_path)
+        self.assertEqual(written.column_names, ['0', '1', '2', '3'])
+        self.assertEqual(written.num_rows, 3)
     
     def test_write_to_parquet_integration(self) -> None:
         """Test actual parquet file writing (integration test)."""
@@ -63,17 +66,290 @@ class TestParquetWriter(unittest.TestCase):
         with self.assertRaises(ValueError):
             writer.write_to_parquet([], "test.parquet")
     
-    @patch('src.export.parquet_writer.pd.DataFrame')
-    def test_write_to_parquet_with_exception(self, mock_dataframe: Mock) -> None:
+    @patch('src.export.parquet_writer.pq.write_table')
+    def test_write_to_parquet_with_exception(self, mock_write_table: Mock) -> None:
         """Test parquet writing with exception."""
-        mock_df: Mock = MagicMock()
-        mock_df.to_parquet.side_effect = Exception("Write error")
-        mock_dataframe.return_value = mock_df
+        mock_write_table.side_effect = Exception("Write error")
         
         file_path: str = 'test_output.parquet'
         
         with self.assertRaises(Exception):
             self.parquet_writer.write_to_parquet(self.test_data, file_path)
+    
+    def test_write_to_parquet_dict_rows(self) -> None:
+        """Test that dictionary rows use their keys as column names."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            data: List[Dict[str, Any]] = [{'id': 1, 'name': 'John'}, {'id': 2, 'name': None}]
+            
+            self.parquet_writer.write_to_parquet(data, file_path)
+            
+            self.assertEqual(pq.read_table(file_path).to_pylist(), data)
+            self.assertEqual(pq.ParquetFile(file_path).metadata.row_group(0).column(0).compression, 'ZSTD')
+    
+    def test_write_to_parquet_compression_options(self) -> None:
+        """Test that compression and row group size can be overridden."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_to_parquet(self.test_data, file_path, compression='snappy', row_group_size=2)
+            
+            metadata = pq.ParquetFile(file_path).metadata
+            self.assertEqual(metadata.num_row_groups, 2)
+            self.assertEqual(metadata.row_group(0).column(0).compression, 'SNAPPY')
+    
+    def test_write_columns_to_parquet(self) -> None:
+        """Test writing column-oriented data."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_columns_to_parquet(['id', 'name'], [[1, 2], ['John', None]], file_path)
+            
+            self.assertEqual(pq.read_table(file_path).to_pylist(), [{'id': 1, 'name': 'John'}, {'id': 2, 'name': None}])
+    
+    def test_write_columns_to_parquet_options(self) -> None:
+        """Test that column-oriented writes honour compression, row group size and dictionary options."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_columns_to_parquet(
+                ['id', 'name'], [[1, 2, 3], ['a', 'a', 'b']], file_path,
+                compression='snappy', row_group_size=2, use_dictionary=False
+            )
+            
+            metadata: pq.FileMetaData = pq.ParquetFile(file_path).metadata
+            self.assertEqual(metadata.num_row_groups, 2)
+            column: pq.ColumnChunkMetaData = metadata.row_group(0).column(1)
+            self.assertEqual(column.compression, 'SNAPPY')
+            self.assertNotIn('RLE_DICTIONARY', column.encodings)
+    
+    def test_write_batches_to_parquet(self) -> None:
+        """Test that row chunks are streamed into one Parquet file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            row_count: int = self.parquet_writer.write_batches_to_parquet(
+                [self.test_data[:2], [], self.test_data[2:]], file_path
+            )
+            
+            self.assertEqual(row_count, 3)
+            self.assertEqual(pq.read_table(file_path).column('1').to_pylist(), ['John', 'Jane', 'Bob'])
+    
+    def test_write_stream_one_row_group_per_batch(self) -> None:
+        """Test that streamed column batches each become their own row group."""
+        batches: List[Dict[str, List[Any]]] = [
+            {'id': [1, 2], 'name': ['John', 'Jane']},
+            {'id': [], 'name': []},
+            {'id': [3], 'name': [None]},
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'stream.parquet')
+            
+            row_count: int = self.parquet_writer.write_stream(iter(batches), file_path)
+            
+            self.assertEqual(row_count, 3)
+            self.assertEqual(pq.ParquetFile(file_path).metadata.num_row_groups, 2)
+            self.assertEqual(pq.read_table(file_path).column('name').to_pylist(), ['John', 'Jane', None])
+    
+    def test_write_stream_null_first_batch(self) -> None:
+        """Test a column that is NULL in the first batch takes its type from a later one."""
+        batches: List[Dict[str, List[Any]]] = [
+            {'id': [1, 2], 'created': [None, None]},
+            {'id': [3], 'created': [datetime.datetime(2024, 1, 1)]},
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'stream.parquet')
+            
+            row_count: int = self.parquet_writer.write_stream(iter(batches), file_path)
+            
+            parquet_file: pq.ParquetFile = pq.ParquetFile(file_path)
+            self.assertEqual(row_count, 3)
+            self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+            self.assertEqual(parquet_file.schema_arrow.field('created').type, pa.timestamp('us'))
+    
+    def test_incremental_write_appends_to_one_file(self) -> None:
+        """Test open()/write_batch()/close() through the context manager."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            with self.parquet_writer.open(file_path) as writer:
+                writer.write_batch([{'id': 1, 'name': 'John'}])
+                writer.write_batch([{'id': 2, 'name': 'Jane'}, {'id': 3, 'name': 'Bob'}])
+            
+            self.assertEqual(writer.rows_written, 3)
+            self.assertEqual(pq.read_table(file_path).column('id').to_pylist(), [1, 2, 3])
+    
+    def test_incremental_write_tuple_rows_with_schema(self) -> None:
+        """Test tuple rows are labelled by an explicit schema's field names."""
+        schema: pa.Schema = pa.schema([('id', pa.int32()), ('name', pa.string())])
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            with self.parquet_writer.open(file_path, schema) as writer:
+                writer.write_batch([(1, 'John'), (2, 'Jane')])
+                writer.write_batch([(3, None)])
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(table.schema, schema)
+            self.assertEqual(table.column('name').to_pylist(), ['John', 'Jane', None])
+    
+    def test_write_batches_to_parquet_null_first_chunk(self) -> None:
+        """Test a column that is NULL in the first chunk takes its type from a later one."""
+        chunks: List[List[Dict[str, Any]]] = [
+            [{'id': 1, 'amount': None}],
+            [{'id': 2, 'amount': decimal.Decimal('1.50')}],
+            [{'id': 3, 'amount': decimal.Decimal('12345.25')}],
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            row_count: int = self.parquet_writer.write_batches_to_parquet(chunks, file_path)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(row_count, 3)
+            self.assertEqual(table.schema.field('amount').type, pa.decimal128(38, 2))
+            self.assertEqual(table.column('id').to_pylist(), [1, 2, 3])
+    
+    def test_write_batch_without_open_raises(self) -> None:
+        """Test that write_batch() requires open()."""
+        with self.assertRaises(RuntimeError):
+            self.parquet_writer.write_batch([(1, 'John')])
+    
+    def test_write_cursor_to_parquet(self) -> None:
+        """Test that a cursor is drained with fetchmany into one Parquet file."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'John'), (2, 'Jane')], [(3, None)], []]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            row_count: int = self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path, batch_size=2)
+            
+            self.assertEqual(row_count, 3)
+            self.assertEqual(pq.read_table(file_path).column('name').to_pylist(), ['John', 'Jane', None])
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.fetchall.assert_not_called()
+    
+    def test_write_cursor_to_parquet_typed_columns(self) -> None:
+        """Test numeric type codes convert correctly, with and without NULLs."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [
+            ('id', int, None, None, None, None, False),
+            ('score', float, None, None, None, None, True),
+        ]
+        mock_cursor.fetchmany.side_effect = [[(1, 1.5), (2, None)], [(3, 2.5)], []]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(table.schema.field('id').type, pa.int64())
+            self.assertEqual(table.column('score').to_pylist(), [1.5, None, 2.5])
+    
+    def test_write_cursor_to_parquet_all_numeric_columns(self) -> None:
+        """Test all-float batches convert in one pass and NULLs still round-trip."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [
+            ('x', float, None, None, None, None, True),
+            ('y', float, None, None, None, None, True),
+        ]
+        mock_cursor.fetchmany.side_effect = [[(1.0, 2.0), (3.0, 4.0)], [(5.0, None)], []]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(table.column('x').to_pylist(), [1.0, 3.0, 5.0])
+            self.assertEqual(table.column('y').to_pylist(), [2.0, 4.0, None])
+    
+    def test_write_cursor_to_parquet_null_first_batch(self) -> None:
+        """Test a column that is all NULL in the first batch takes its later type."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [
+            ('id', int, None, None, None, None, False),
+            ('note', object, None, None, None, None, True),
+        ]
+        mock_cursor.fetchmany.side_effect = [[(1, None), (2, None)], [(3, 'late')], []]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            row_count: int = self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(row_count, 3)
+            self.assertEqual(table.schema.field('note').type, pa.string())
+            self.assertEqual(table.column('note').to_pylist(), [None, None, 'late'])
+    
+    def test_write_cursor_to_parquet_widens_inferred_decimal(self) -> None:
+        """Test an untyped DECIMAL whose later batches hold more digits than the first."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('amount', object, None, None, None, None, True)]
+        mock_cursor.fetchmany.side_effect = [
+            [(decimal.Decimal('1.50'),)],
+            [(decimal.Decimal('123456789.25'),)],
+            [],
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path, batch_size=1)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(table.schema.field('amount').type, pa.decimal128(38, 2))
+            self.assertEqual(
+                table.column('amount').to_pylist(),
+                [decimal.Decimal('1.50'), decimal.Decimal('123456789.25')]
+            )
+    
+    def test_write_cursor_to_parquet_all_null_column(self) -> None:
+        """Test a column that never holds a value is written null-typed."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [
+            ('id', int, None, None, None, None, False),
+            ('note', object, None, None, None, None, True),
+        ]
+        mock_cursor.fetchmany.side_effect = [[(1, None)], [(2, None)], []]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'test_output.parquet')
+            
+            self.parquet_writer.write_cursor_to_parquet(mock_cursor, file_path)
+            
+            table: pa.Table = pq.read_table(file_path)
+            self.assertEqual(table.column('id').to_pylist(), [1, 2])
+            self.assertEqual(table.schema.field('note').type, pa.null())
+    
+    def test_schema_from_description(self) -> None:
+        """Test Arrow schema derivation from pyodbc-style type codes."""
+        description = [
+            ('id', int, None, 10, 10, 0, False),
+            ('amount', decimal.Decimal, None, 12, 12, 2, True),
+            ('created', datetime.datetime, None, 23, 23, 3, True),
+        ]
+        
+        schema = schema_from_description(description)
+        
+        self.assertEqual(schema.types, [pa.int64(), pa.decimal128(12, 2), pa.timestamp('us')])
+        self.assertIsNone(schema_from_description([('blob', object, None, None, None, None, True)]))
+    
+    def test_schema_from_description_mysql_decimal(self) -> None:
+        """Test a DECIMAL without precision, as mysql-connector reports it, keeps its scale."""
+        description = [('amount', FieldType.NEWDECIMAL, None, None, None, 2, True, 0)]
+        
+        schema = schema_from_description(description)
+        
+        self.assertEqual(schema.types, [pa.decimal128(38, 2)])
 
 
 if __name__ == '__main__':
@@ -1,183 +1,568 @@
 import unittest
-from unittest.mock import Mock, MagicMock
-from typing import List, Tuple, Any
+import os
+import tempfile
+from unittest.mock import Mock, MagicMock, PropertyMock, patch
+from typing import List, Tuple, Dict, Any
+import pyarrow as pa
+import pyarrow.parquet as pq
 from mysql.connector import MySQLConnection
+from mysql.connector.pooling import MySQLConnectionPool
 
+from src.query.query_cache import QueryResultCache
 from src.query.query_executor import QueryExecutor
 
 
 class TestQueryExecutor(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the spec'd connection mock once; introspecting MySQLConnection is not free."""
+        cls.mock_connection: Mock = Mock(spec=MySQLConnection)
+    
     def setUp(self) -> None:
         """Set up test fixtures before each test method."""
-        self.mock_connection: Mock = Mock(spec=MySQLConnection)
+        self.mock_connection.reset_mock(return_value=True, side_effect=True)
         self.query_executor: QueryExecutor = QueryExecutor(self.mock_connection)
     
-    def test_execute_query_success(self):
-        """Test successful query execution returns list of dictionaries."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('John', 25), ('Jane', 30)]
-        mock_cursor.description = [('name',), ('age',)]
+    def _run(
+        self,
+        rows: List[Tuple[Any, ...]],
+        description: List[Tuple[str]],
+        query: str,
+        expected: List[Dict[str, Any]]
+    ) -> None:
+        """Execute query against a cursor returning rows in one batch and check the dictionaries."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.fetchmany.side_effect = [rows, []]
+        mock_cursor.description = description
         
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, age FROM users")
+        executor: QueryExecutor = QueryExecutor(self.mock_connection)
+        result: List[Dict[str, Any]] = executor.execute_query(query)
         
-        expected = [{'name': 'John', 'age': 25}, {'name': 'Jane', 'age': 30}]
         self.assertEqual(result, expected)
+    
+    def test_execute_query_returns_dictionaries(self) -> None:
+        """Test that assorted SELECTs (aggregates, joins, NULLs, quoting, ...) return lists of dictionaries."""
+        cases: List[Tuple[str, List[Tuple[Any, ...]], List[Tuple[str]], str, List[Dict[str, Any]]]] = [
+            (
+                "success",
+                [('John', 25), ('Jane', 30)], [('name',), ('age',)],
+                "SELECT name, age FROM users",
+                [{'name': 'John', 'age': 25}, {'name': 'Jane', 'age': 30}],
+            ),
+            (
+                "aggregate",
+                [(5,)], [('count',)],
+                "SELECT COUNT(*) as count FROM users",
+                [{'count': 5}],
+            ),
+            (
+                "group by",
+                [('Engineering', 3), ('Marketing', 2)], [('department',), ('count',)],
+                "SELECT department, COUNT(*) as count FROM users GROUP BY department",
+                [{'department': 'Engineering', 'count': 3}, {'department': 'Marketing', 'count': 2}],
+            ),
+            (
+                "join",
+                [('John', 'Product A'), ('Jane', 'Product B')], [('user_name',), ('product_name',)],
+                "SELECT u.name as user_name, p.name as product_name FROM users u JOIN products p ON u.id = p.user_id",
+                [{'user_name': 'John', 'product_name': 'Product A'}, {'user_name': 'Jane', 'product_name': 'Product B'}],
+            ),
+            (
+                "limit offset",
+                [('Jane', 30)], [('name',), ('age',)],
+                "SELECT name, age FROM users LIMIT 1 OFFSET 1",
+                [{'name': 'Jane', 'age': 30}],
+            ),
+            (
+                "order by",
+                [('Jane', 30), ('John', 25)], [('name',), ('age',)],
+                "SELECT name, age FROM users ORDER BY age DESC",
+                [{'name': 'Jane', 'age': 30}, {'name': 'John', 'age': 25}],
+            ),
+            (
+                "null values",
+                [('John', None), ('Jane', 30)], [('name',), ('age',)],
+                "SELECT name, age FROM users",
+                [{'name': 'John', 'age': None}, {'name': 'Jane', 'age': 30}],
+            ),
+            (
+                "special characters",
+                [("O'Connor", "john@example.com")], [('name',), ('email',)],
+                "SELECT name, email FROM users WHERE name = 'O''Connor'",
+                [{'name': "O'Connor", 'email': "john@example.com"}],
+            ),
+            (
+                "where clause",
+                [('Jane', 30)], [('name',), ('age',)],
+                "SELECT name, age FROM users WHERE age > 25",
+                [{'name': 'Jane', 'age': 30}],
+            ),
+            (
+                "simple select",
+                [('John',), ('Jane',)], [('name',)],
+                "SELECT name FROM users",
+                [{'name': 'John'}, {'name': 'Jane'}],
+            ),
+        ]
+        
+        for name, rows, description, query, expected in cases:
+            with self.subTest(name):
+                self._run(rows, description, query, expected)
 
-    def test_execute_aggregate_query(self):
-        """Test aggregate query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [(5,)]
-        mock_cursor.description = [('count',)]
+    def test_execute_query_empty_results(self) -> None:
+        """Test query execution with empty results."""
+        mock_cursor: Mock = MagicMock()
+        expected_results: List[Tuple[Any, ...]] = []
+        mock_cursor.fetchmany.side_effect = [expected_results, []]
+        self.mock_connection.cursor.return_value = mock_cursor
         
+        query: str = "SELECT * FROM empty_table"
+        results: List[Tuple[Any, ...]] = self.query_executor.execute_query(query)
+        
+        self.assertEqual(results, expected_results)
+        mock_cursor.close.assert_not_called()
+        
+        # The cursor stays open for reuse until the executor is closed
+        self.query_executor.close()
+        mock_cursor.close.assert_called_once()
+    
+    def test_execute_query_reuses_cursor(self) -> None:
+        """Test that consecutive queries run on one cursor instead of reopening it."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], [], [(2,)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT COUNT(*) as count FROM users")
+        self.query_executor.execute_query("SELECT id FROM users WHERE id = 1")
+        self.query_executor.execute_query("SELECT id FROM users WHERE id = 2")
         
-        expected = [{'count': 5}]
-        self.assertEqual(result, expected)
-
-    def test_execute_group_by_query(self):
-        """Test GROUP BY query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('Engineering', 3), ('Marketing', 2)]
-        mock_cursor.description = [('department',), ('count',)]
+        self.mock_connection.cursor.assert_called_once_with()
+        self.assertEqual(mock_cursor.execute.call_count, 2)
+    
+    def test_execute_query_with_params_uses_prepared_cursor(self) -> None:
+        """Test that bind parameters are executed through a prepared cursor."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('name',)]
+        mock_cursor.fetchmany.side_effect = [[('Jane',)], []]
+        self.mock_connection.cursor.return_value = mock_cursor
         
+        results: List[Dict[str, Any]] = self.query_executor.execute_query(
+            "SELECT name FROM users WHERE age > %s", (25,)
+        )
+        
+        self.assertEqual(results, [{'name': 'Jane'}])
+        self.mock_connection.cursor.assert_called_once_with(prepared=True)
+        mock_cursor.execute.assert_called_once_with("SELECT name FROM users WHERE age > %s", (25,))
+    
+    def test_execute_query_column_names_needing_escapes(self) -> None:
+        """Test that quotes and backslashes in column names survive the compiled row builder."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [("it's",), ('a\\b',), ('"x"',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 2, 3)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT department, COUNT(*) as count FROM users GROUP BY department")
+        results: List[Dict[str, Any]] = self.query_executor.execute_query("SELECT 1, 2, 3")
         
-        expected = [{'department': 'Engineering', 'count': 3}, {'department': 'Marketing', 'count': 2}]
-        self.assertEqual(result, expected)
-
-    def test_execute_join_query(self):
-        """Test JOIN query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('John', 'Product A'), ('Jane', 'Product B')]
-        mock_cursor.description = [('user_name',), ('product_name',)]
+        self.assertEqual(results, [{"it's": 1, 'a\\b': 2, '"x"': 3}])
+    
+    def test_execute_query_uses_fetch_size(self) -> None:
+        """Test that rows are fetched in fetch_size batches."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+        self.mock_connection.cursor.return_value = mock_cursor
         
+        executor: QueryExecutor = QueryExecutor(self.mock_connection, fetch_size=2)
+        results: List[Dict[str, Any]] = executor.execute_query("SELECT id FROM users")
+        
+        self.assertEqual(results, [{'id': 1}, {'id': 2}, {'id': 3}])
+        self.assertEqual(mock_cursor.arraysize, 2)
+        mock_cursor.fetchmany.assert_called_with(2)
+    
+    def test_execute_query_served_from_cache(self) -> None:
+        """Test that a repeated query is answered by the cache without re-executing."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT u.name as user_name, p.name as product_name FROM users u JOIN products p ON u.id = p.user_id")
+        executor: QueryExecutor = QueryExecutor(self.mock_connection, cache=QueryResultCache(maxsize=2))
+        first: List[Dict[str, Any]] = executor.execute_query("SELECT id FROM users")
+        second: List[Dict[str, Any]] = executor.execute_query("SELECT id\n  FROM users")
         
-        expected = [{'user_name': 'John', 'product_name': 'Product A'}, {'user_name': 'Jane', 'product_name': 'Product B'}]
-        self.assertEqual(result, expected)
-
-    def test_execute_limit_offset_query(self):
-        """Test LIMIT and OFFSET query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('Jane', 30)]
-        mock_cursor.description = [('name',), ('age',)]
+        self.assertEqual(first, [{'id': 1}])
+        self.assertEqual(second, first)
+        mock_cursor.execute.assert_called_once()
+    
+    def test_execute_query_tuple_mode_returns_rows(self) -> None:
+        """Test that tuple_mode returns the fetched rows without building dictionaries or caching."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'John'), (2, 'Jane')], []]
+        self.mock_connection.cursor.return_value = mock_cursor
         
+        cache: QueryResultCache = QueryResultCache()
+        executor: QueryExecutor = QueryExecutor(self.mock_connection, cache=cache)
+        results: List[Tuple[Any, ...]] = executor.execute_query("SELECT id, name FROM users", tuple_mode=True)
+        
+        self.assertEqual(results, [(1, 'John'), (2, 'Jane')])
+        self.assertEqual(len(cache), 0)
+    
+    def test_cached_rows_unaffected_by_caller_mutation(self) -> None:
+        """Test that mutating returned rows does not change what later cache hits return."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, age FROM users LIMIT 1 OFFSET 1")
+        executor: QueryExecutor = QueryExecutor(self.mock_connection, cache=QueryResultCache())
+        first: List[Dict[str, Any]] = executor.execute_query("SELECT id FROM users")
+        first[0]['total'] = 10
+        second: List[Dict[str, Any]] = executor.execute_query("SELECT id FROM users")
+        self.assertEqual(second, [{'id': 1}])
         
-        expected = [{'name': 'Jane', 'age': 30}]
-        self.assertEqual(result, expected)
+        second[0]['id'] = 2
+        third: List[Dict[str, Any]] = executor.execute_query("SELECT id FROM users")
+        
+        self.assertEqual(third, [{'id': 1}])
+        mock_cursor.execute.assert_called_once()
+    
+    def test_query_cache_evicts_least_recently_used(self) -> None:
+        """Test that the cache keeps at most maxsize result sets."""
+        cache: QueryResultCache = QueryResultCache(maxsize=2)
+        cache.put("SELECT 1", [{'n': 1}])
+        cache.put("SELECT 2", [{'n': 2}])
+        cache.get("SELECT 1")
+        cache.put("SELECT 3", [{'n': 3}])
+        
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("SELECT 2"))
+        self.assertEqual(cache.get("SELECT 1"), [{'n': 1}])
+    
+    def test_query_cache_key_keeps_whitespace_in_literals(self) -> None:
+        """Test that whitespace is collapsed outside quotes but not inside string literals."""
+        key_for = QueryResultCache.key_for
+        
+        self.assertNotEqual(
+            key_for("SELECT * FROM users WHERE name = 'a  b'"),
+            key_for("SELECT * FROM users WHERE name = 'a b'")
+        )
+        self.assertEqual(
+            key_for("SELECT *\n  FROM users WHERE name = 'a  b'"),
+            key_for("SELECT * FROM users WHERE name = 'a  b'")
+        )
+        self.assertNotEqual(
+            key_for("SELECT * FROM users WHERE name = 'it\\'s  a b'"),
+            key_for("SELECT * FROM users WHERE name = 'it\\'s a b'")
+        )
+    
+    def test_execute_query_returns_pooled_connection(self) -> None:
+        """Test that a pooled connection is checked out per query and returned afterwards."""
+        mock_pool: Mock = Mock(spec=MySQLConnectionPool)
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], []]
+        mock_pool.get_connection.return_value.cursor.return_value = mock_cursor
+        
+        results: List[Dict[str, Any]] = QueryExecutor(mock_pool).execute_query("SELECT id FROM users")
+        
+        self.assertEqual(results, [{'id': 1}])
+        mock_pool.get_connection.assert_called_once()
+        mock_cursor.close.assert_called_once()
+        mock_pool.get_connection.return_value.close.assert_called_once()
+    
+    def test_prepared_statements_cached_per_query_text(self) -> None:
+        """Test that each parameterized query keeps its own prepared cursor, evicting the oldest."""
+        cursors: List[Mock] = []
+        
+        def new_cursor(**kwargs: Any) -> Mock:
+            cursor: Mock = MagicMock()
+            cursor.description = [('id',)]
+            cursor.fetchmany.return_value = []
+            cursors.append(cursor)
+            return cursor
+        
+        self.mock_connection.cursor.side_effect = new_cursor
+        executor: QueryExecutor = QueryExecutor(self.mock_connection, statement_cache_size=2)
+        
+        executor.execute_query("SELECT id FROM users WHERE id = %s", (1,))
+        executor.execute_query("SELECT id FROM users WHERE id = %s", (2,))
+        executor.execute_query("SELECT id FROM orders WHERE id = %s", (1,))
+        self.assertEqual(len(cursors), 2)
+        self.assertEqual(cursors[0].execute.call_count, 2)
+        
+        # A third statement evicts the least recently used prepared cursor
+        executor.execute_query("SELECT id FROM items WHERE id = %s", (1,))
+        cursors[0].close.assert_called_once()
+        cursors[1].close.assert_not_called()
+    
+    def test_context_manager_closes_cached_cursors(self) -> None:
+        """Test that leaving a with block closes the cursors execute_query kept open."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.return_value = []
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        with QueryExecutor(self.mock_connection) as executor:
+            executor.execute_query("SELECT id FROM users")
+            mock_cursor.close.assert_not_called()
+        
+        mock_cursor.close.assert_called_once()
+    
+    def test_execute_query_with_exception(self) -> None:
+        """Test query execution with database exception."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.execute.side_effect = Exception("SQL syntax error")
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        query: str = "INVALID SQL QUERY"
+        
+        with self.assertRaises(Exception):
+            self.query_executor.execute_query(query)
+        
+        # Ensure cursor is still closed even on exception
+        mock_cursor.close.assert_called_once()
 
-    def test_execute_order_by_query(self):
-        """Test ORDER BY query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('Jane', 30), ('John', 25)]
+    def test_execute_query_columnar(self) -> None:
+        """Test that results come back as column lists instead of row dictionaries."""
+        mock_cursor: Mock = MagicMock()
         mock_cursor.description = [('name',), ('age',)]
+        mock_cursor.fetchmany.side_effect = [[('John', 25), ('Jane', 30)], [('Bob', None)], []]
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        column_names, columns = self.query_executor.execute_query_columnar("SELECT name, age FROM users")
         
+        self.assertEqual(column_names, ['name', 'age'])
+        self.assertEqual(columns, [['John', 'Jane', 'Bob'], [25, 30, None]])
+        mock_cursor.close.assert_called_once()
+
+    def test_iter_query_yields_rows_lazily(self) -> None:
+        """Test that iter_query yields rows batch by batch instead of calling fetchall."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'John')], [(2, 'Jane')], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, age FROM users ORDER BY age DESC")
+        rows = self.query_executor.iter_query("SELECT id, name FROM users")
         
-        expected = [{'name': 'Jane', 'age': 30}, {'name': 'John', 'age': 25}]
-        self.assertEqual(result, expected)
+        self.assertEqual(next(rows), {'id': 1, 'name': 'John'})
+        self.assertEqual(list(rows), [{'id': 2, 'name': 'Jane'}])
+        mock_cursor.fetchall.assert_not_called()
+        mock_cursor.close.assert_called_once()
 
-    def test_execute_query_with_null_values(self):
-        """Test query execution with NULL values."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('John', None), ('Jane', 30)]
-        mock_cursor.description = [('name',), ('age',)]
+    def test_iter_query_columns_yields_column_batches(self) -> None:
+        """Test that each fetchmany batch is yielded as a column dictionary."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('id',), ('name',)]
+        mock_cursor.fetchmany.side_effect = [[(1, 'John'), (2, 'Jane')], [(3, 'Bob')], []]
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        batches = list(self.query_executor.iter_query_columns("SELECT id, name FROM users"))
         
+        self.assertEqual(batches, [
+            {'id': [1, 2], 'name': ['John', 'Jane']},
+            {'id': [3], 'name': ['Bob']},
+        ])
+        mock_cursor.close.assert_called_once()
+
+    def test_iter_query_batches_types_mysql_columns(self) -> None:
+        """Test that MySQL FieldType codes drive the Arrow types of each record batch."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [
+            ('id', 8, None, None, None, None, 0, 0),
+            ('name', 253, None, None, None, None, 1, 0),
+        ]
+        mock_cursor.fetchmany.side_effect = [[(1, 'John'), (2, None)], [(3, 'Bob')], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, age FROM users")
+        batches: List[pa.RecordBatch] = list(self.query_executor.iter_query_batches("SELECT id, name FROM users"))
         
-        expected = [{'name': 'John', 'age': None}, {'name': 'Jane', 'age': 30}]
-        self.assertEqual(result, expected)
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[0].schema, pa.schema([('id', pa.int64()), ('name', pa.string())]))
+        self.assertEqual(batches[0].column('name').to_pylist(), ['John', None])
+        mock_cursor.close.assert_called_once()
 
-    def test_execute_query_with_special_characters(self):
-        """Test query execution with special characters."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [("O'Connor", "john@example.com")]
-        mock_cursor.description = [('name',), ('email',)]
+    def test_execute_multi_query_returns_each_result_set(self) -> None:
+        """Test batched queries return one list of dictionaries per result set."""
+        result_sets: List[Tuple[Any, ...]] = [
+            ([('name',)], [('John',), ('Jane',)]),
+            ([('count',)], [(2,)]),
+        ]
+        position: List[int] = [0]
+        
+        def nextset() -> bool:
+            position[0] += 1
+            return position[0] < len(result_sets)
         
+        mock_cursor: Mock = MagicMock()
+        type(mock_cursor).description = PropertyMock(side_effect=lambda: result_sets[position[0]][0])
+        mock_cursor.fetchall.side_effect = lambda: result_sets[position[0]][1]
+        mock_cursor.nextset.side_effect = nextset
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, email FROM users WHERE name = 'O''Connor'")
+        results: List[List[Dict[str, Any]]] = self.query_executor.execute_multi_query(
+            ["SELECT name FROM users", "SELECT COUNT(*) AS count FROM users"]
+        )
         
-        expected = [{'name': "O'Connor", 'email': "john@example.com"}]
-        self.assertEqual(result, expected)
+        self.assertEqual(results, [[{'name': 'John'}, {'name': 'Jane'}], [{'count': 2}]])
+        mock_cursor.execute.assert_called_once_with(
+            "SELECT name FROM users\n;\nSELECT COUNT(*) AS count FROM users"
+        )
+        mock_cursor.close.assert_called_once()
 
-    def test_execute_query_with_where_clause(self):
-        """Test query execution with WHERE clause."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('Jane', 30)]
-        mock_cursor.description = [('name',), ('age',)]
+    def test_execute_multi_to_parquet_writes_each_result_set(self) -> None:
+        """Test batched queries stream each result set into its own Parquet file."""
+        result_sets: List[Tuple[Any, ...]] = [
+            ([('name',)], [[('John',), ('Jane',)], []]),
+            ([('count',)], [[(2,)], []]),
+        ]
+        position: List[int] = [0]
+        
+        def nextset() -> bool:
+            position[0] += 1
+            return position[0] < len(result_sets)
         
+        mock_cursor: Mock = MagicMock()
+        type(mock_cursor).description = PropertyMock(side_effect=lambda: result_sets[position[0]][0])
+        mock_cursor.fetchmany.side_effect = lambda size: result_sets[position[0]][1].pop(0)
+        mock_cursor.nextset.side_effect = nextset
         self.mock_connection.cursor.return_value = mock_cursor
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name, age FROM users WHERE age > 25")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths: List[str] = [os.path.join(temp_dir, 'users.parquet'), os.path.join(temp_dir, 'count.parquet')]
+            
+            results = self.query_executor.execute_multi_to_parquet(
+                ["SELECT name FROM users", "SELECT COUNT(*) AS count FROM users"], paths, preview_rows=1
+            )
+            
+            self.assertEqual(results, [(2, [{'name': 'John'}]), (1, [{'count': 2}])])
+            self.assertEqual(pq.read_table(paths[0]).to_pylist(), [{'name': 'John'}, {'name': 'Jane'}])
+            self.assertEqual(pq.read_table(paths[1]).to_pylist(), [{'count': 2}])
+        mock_cursor.close.assert_called_once()
+
+    def test_execute_multi_to_arrow_returns_table_per_result_set(self) -> None:
+        """Test batched queries return one columnar Arrow table per result set."""
+        result_sets: List[Tuple[Any, ...]] = [
+            ([('name',)], [[('John',), ('Jane',)], []]),
+            ([('count',)], [[]]),
+        ]
+        position: List[int] = [0]
+        
+        def nextset() -> bool:
+            position[0] += 1
+            return position[0] < len(result_sets)
         
-        expected = [{'name': 'Jane', 'age': 30}]
-        self.assertEqual(result, expected)
+        mock_cursor: Mock = MagicMock()
+        type(mock_cursor).description = PropertyMock(side_effect=lambda: result_sets[position[0]][0])
+        mock_cursor.fetchmany.side_effect = lambda size: result_sets[position[0]][1].pop(0)
+        mock_cursor.nextset.side_effect = nextset
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        names, counts = self.query_executor.execute_multi_to_arrow(
+            ["SELECT name FROM users", "SELECT COUNT(*) AS count FROM users WHERE 1 = 0"]
+        )
+        
+        self.assertEqual(names.column('name').to_pylist(), ['John', 'Jane'])
+        self.assertEqual(counts.num_rows, 0)
+        self.assertEqual(counts.column_names, ['count'])
+        mock_cursor.close.assert_called_once()
 
-    def test_execute_simple_select_query(self):
-        """Test simple SELECT query execution."""
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [('John',), ('Jane',)]
+    def test_execute_to_parquet_streams_batches(self) -> None:
+        """Test that fetchmany batches are streamed into a single Parquet file."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('name',), ('age',)]
+        mock_cursor.fetchmany.side_effect = [[('John', 25), ('Jane', 30)], [('Bob', 35)], []]
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'users.parquet')
+            
+            row_count, preview = self.query_executor.execute_to_parquet(
+                "SELECT name, age FROM users", file_path, batch_size=2, preview_rows=1
+            )
+            table: pa.Table = pq.read_table(file_path)
+        
+        self.assertEqual(row_count, 3)
+        self.assertEqual(preview, [{'name': 'John', 'age': 25}])
+        self.assertEqual(table.column_names, ['name', 'age'])
+        self.assertEqual(table.column('name').to_pylist(), ['John', 'Jane', 'Bob'])
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.close.assert_called_once()
+    
+    def test_execute_to_parquet_uses_writer_defaults(self) -> None:
+        """Test that the streamed file gets the exporter's ZSTD compression, not pyarrow's default."""
+        mock_cursor: Mock = MagicMock()
         mock_cursor.description = [('name',)]
+        mock_cursor.fetchmany.side_effect = [[('John',)], []]
+        self.mock_connection.cursor.return_value = mock_cursor
         
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'users.parquet')
+            
+            self.query_executor.execute_to_parquet("SELECT name FROM users", file_path)
+            metadata: pq.FileMetaData = pq.ParquetFile(file_path).metadata
+        
+        self.assertEqual(metadata.row_group(0).column(0).compression, 'ZSTD')
+    
+    def test_execute_to_parquet_raises_writer_close_error(self) -> None:
+        """Test that a failure writing the file footer reaches the caller."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('name',)]
+        mock_cursor.fetchmany.side_effect = [[('John',)], []]
         self.mock_connection.cursor.return_value = mock_cursor
+        mock_writer: Mock = Mock()
+        mock_writer.close.side_effect = OSError("disk full")
         
-        executor = QueryExecutor(self.mock_connection)
-        result = executor.execute_query("SELECT name FROM users")
+        with patch('src.query.query_executor._open_writer', return_value=mock_writer):
+            with self.assertRaises(OSError):
+                self.query_executor.execute_to_parquet("SELECT name FROM users", "users.parquet")
         
-        expected = [{'name': 'John'}, {'name': 'Jane'}]
-        self.assertEqual(result, expected)
+        mock_writer.write_batch.assert_called_once()
+    
+    def test_execute_to_parquet_empty_result_writes_nothing(self) -> None:
+        """Test that an empty result set returns zero rows and writes no file."""
+        mock_cursor: Mock = MagicMock()
+        mock_cursor.description = [('name',)]
+        mock_cursor.fetchmany.return_value = []
+        self.mock_connection.cursor.return_value = mock_cursor
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: str = os.path.join(temp_dir, 'empty.parquet')
+            
+            row_count, preview = self.query_executor.execute_to_parquet("SELECT name FROM users", file_path)
+            
+            self.assertEqual((row_count, preview), (0, []))
+            self.assertFalse(os.path.exists(file_path))
 
-    def test_execute_query_empty_results(self) -> None:
-        """Test query execution with empty results."""
+    @patch('src.query.query_executor.pq.ParquetWriter')
+    def test_execute_to_parquet_raises_write_errors(self, mock_writer_class: Mock) -> None:
+        """Test that a failure on the writer thread is raised to the caller."""
+        mock_writer_class.return_value.write_batch.side_effect = OSError("disk full")
         mock_cursor: Mock = MagicMock()
-        expected_results: List[Tuple[Any, ...]] = []
-        mock_cursor.fetchall.return_value = expected_results
+        mock_cursor.description = [('id',)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], [(2,)], [(3,)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        query: str = "SELECT * FROM empty_table"
-        results: List[Tuple[Any, ...]] = self.query_executor.execute_query(query)
+        with self.assertRaises(OSError):
+            self.query_executor.execute_to_parquet("SELECT id FROM users", 'users.parquet', batch_size=1)
         
-        self.assertEqual(results, expected_results)
+        mock_writer_class.return_value.close.assert_called_once()
         mock_cursor.close.assert_called_once()
-    
-    def test_execute_query_with_exception(self) -> None:
-        """Test query execution with database exception."""
+
+    def test_execute_to_arrow_returns_table(self) -> None:
+        """Test that cursor batches are combined into one Arrow table."""
         mock_cursor: Mock = MagicMock()
-        mock_cursor.execute.side_effect = Exception("SQL syntax error")
+        mock_cursor.description = [('name',), ('age',)]
+        mock_cursor.fetchmany.side_effect = [[('John', 25)], [('Jane', None)], []]
         self.mock_connection.cursor.return_value = mock_cursor
         
-        query: str = "INVALID SQL QUERY"
-        
-        with self.assertRaises(Exception):
-            self.query_executor.execute_query(query)
+        table: pa.Table = self.query_executor.execute_to_arrow("SELECT name, age FROM users", batch_size=1)
         
-        # Ensure cursor is still closed even on exception
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.to_pylist(), [{'name': 'John', 'age': 25}, {'name': 'Jane', 'age': None}])
         mock_cursor.close.assert_called_once()
 
 
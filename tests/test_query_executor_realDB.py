@@ -1,156 +1,334 @@
 import unittest
 import os
-from typing import List, Dict, Any, Optional
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import List, Dict, Any, Optional, Tuple
 from unittest import skipIf
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector import pooling
 
 from src.database.mysql_connection import MySQLConnection
 from src.query.query_executor import QueryExecutor
 from config.database_config import DatabaseConfig
 
+# Fixture rows, inserted once per class; the last two back the special
+# character and NULL tests so those tests only read. tests/fixtures.sql
+# holds the same rows for servers that load them at boot
+_USERS: List[Tuple[str, str, Optional[int]]] = [
+    ('John Doe', 'john.doe@example.com', 30),
+    ('Jane Smith', 'jane.smith@example.com', 25),
+    ('Bob Johnson', 'bob.johnson@example.com', 35),
+    ('Alice Brown', 'alice.brown@example.com', 28),
+    ('Charlie Wilson', 'charlie.wilson@example.com', 32),
+    ('Test User & Co.', 'test+special@example.com', 30),
+    ('Test User NULL', 'test_null@example.com', None),
+]
 
+_ORDERS: List[Tuple[int, str, int, Decimal]] = [
+    (1, 'Laptop', 1, Decimal('999.99')),
+    (1, 'Mouse', 2, Decimal('25.50')),
+    (2, 'Keyboard', 1, Decimal('75.00')),
+    (2, 'Monitor', 1, Decimal('299.99')),
+    (3, 'Tablet', 1, Decimal('499.99')),
+    (4, 'Headphones', 1, Decimal('199.99')),
+    (4, 'Webcam', 1, Decimal('89.99')),
+    (5, 'Smartphone', 1, Decimal('699.99')),
+]
+
+# Multi-line queries run by the tests below
+_JOIN_QUERY: str = """
+SELECT u.name, u.email, o.product_name, o.quantity, o.price
+FROM users u
+JOIN orders o ON u.id = o.user_id
+ORDER BY u.name, o.product_name
+"""
+
+_AGGREGATE_QUERY: str = """
+SELECT COUNT(*) as user_count, AVG(age) as avg_age, MIN(age) as min_age, MAX(age) as max_age
+FROM users
+"""
+
+_GROUP_BY_QUERY: str = """
+SELECT u.name, COUNT(o.id) as order_count, SUM(o.price) as total_spent
+FROM users u
+LEFT JOIN orders o ON u.id = o.user_id
+GROUP BY u.id, u.name
+ORDER BY u.name
+"""
+
+_CONFIG: DatabaseConfig = DatabaseConfig(
+    host="localhost",
+    user="testuser",
+    password="testpass",
+    database="testdb"
+)
+
+# Connection and executor shared by every test class in this module; the
+# schema and fixture are loaded once in setUpModule, not per class
+_SHARED: Dict[str, Any] = {}
+
+
+# DatabaseConfig has no port; the tests expect the server on MySQL's default
+_MYSQL_PORT: int = 3306
+
+
+def _server_reachable() -> bool:
+    """
+    Check whether anything accepts TCP connections on the MySQL port.
+    
+    Only a socket is opened and closed again, with no MySQL handshake, so
+    collecting this module stays cheap and quiet whether or not a server runs.
+    
+    Returns:
+        True if the port accepted a connection within one second
+    """
+    try:
+        with socket.create_connection((_CONFIG.host, _MYSQL_PORT), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _open_server_pool() -> pooling.MySQLConnectionPool:
+    """
+    Open the server-level connection pool used for fixture DDL/DML.
+    
+    The pool opens its single connection when created, so the fixture setup
+    and cleanup share one handshake. It connects without a database, since
+    setup creates it, and gives up after one second.
+    
+    Returns:
+        The pool
+        
+    Raises:
+        Error: If the server refused the connection
+    """
+    return pooling.MySQLConnectionPool(
+        pool_name="testpool",
+        pool_size=1,
+        host=_CONFIG.host,
+        user=_CONFIG.user,
+        password=_CONFIG.password,
+        # The fixture commits its own transaction. use_pure is left at
+        # its default, which already picks the C extension when it is
+        # installed; passing use_pure=False raises ImportError without it
+        autocommit=False,
+        connect_timeout=1
+    )
+
+
+def _close_server_pool() -> None:
+    """Close the server-level pool's idle connection, if the pool was opened."""
+    global _SERVER_POOL
+    if _SERVER_POOL is not None:
+        # MySQLConnectionPool has no public close(); this closes every
+        # connection currently idle in it
+        _SERVER_POOL._remove_connections()
+        _SERVER_POOL = None
+
+
+# Set once the schema and fixture are in place, so later setup calls in
+# the same process skip re-issuing the CREATE statements
+_SCHEMA_READY: bool = False
+
+# Set when the server already loaded tests/fixtures.sql at boot (e.g. from
+# /docker-entrypoint-initdb.d), so setUpModule only connects
+_PRELOADED: bool = os.environ.get('UPE_REALDB_PRELOADED') == '1'
+
+# Probed once at import so unavailable servers skip the class outright
+DB_AVAILABLE: bool = _server_reachable()
+
+# Opened by setUpModule for the fixture setup, drained by tearDownModule
+_SERVER_POOL: Optional[pooling.MySQLConnectionPool] = None
+
+
+def setUpModule() -> None:
+    """Load the fixture and open the shared connection once per module."""
+    global _SERVER_POOL
+    if not DB_AVAILABLE:
+        return
+    if not _PRELOADED:
+        try:
+            _SERVER_POOL = _open_server_pool()
+            TestQueryExecutorRealDB._setup_test_database()
+        except Error as e:
+            # tearDownModule does not run when setUpModule fails
+            _close_server_pool()
+            raise unittest.SkipTest(f"Could not set up test database: {e}")
+    mysql_connection: MySQLConnection = MySQLConnection(_CONFIG)
+    _SHARED['mysql_connection'] = mysql_connection
+    _SHARED['connection'] = mysql_connection.connect()
+    _SHARED['query_executor'] = QueryExecutor(_SHARED['connection'])
+
+
+def tearDownModule() -> None:
+    """Close the shared cursors, connection and server pool after the last test class has run."""
+    # The executor keeps one cursor open across every test's execute_query
+    query_executor: Optional[QueryExecutor] = _SHARED.pop('query_executor', None)
+    if query_executor:
+        query_executor.close()
+    mysql_connection: Optional[MySQLConnection] = _SHARED.pop('mysql_connection', None)
+    if mysql_connection:
+        # Optionally clean up test data
+        # TestQueryExecutorRealDB._cleanup_test_database()
+        mysql_connection.close()
+    _SHARED.clear()
+    _close_server_pool()
+
+
+@skipIf(not DB_AVAILABLE, "MySQL unavailable")
 class TestQueryExecutorRealDB(unittest.TestCase):
     """
     Integration tests for QueryExecutor using real MySQL database.
     
     This test class automatically sets up the required test database and tables.
+    The tests only read the fixture, so they are safe to run under pytest-xdist.
     """
     
-    @classmethod
-    def setUpClass(cls) -> None:
-        """Set up test database configuration and create test data."""
-        cls.config: DatabaseConfig = DatabaseConfig(
-            host="localhost",
-            user="testuser",
-            password="testpass",
-            database="testdb"
-        )
-        
-        # Check if we can connect to MySQL server
-        cls.db_available: bool = cls._check_mysql_server_availability()
-        
-        if cls.db_available:
-            cls._setup_test_database()
-            cls.mysql_connection: MySQLConnection = MySQLConnection(cls.config)
-            cls.connection = cls.mysql_connection.connect()
-            cls.query_executor: QueryExecutor = QueryExecutor(cls.connection)
-    
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """Clean up database connection and optionally drop test data."""
-        if hasattr(cls, 'mysql_connection') and cls.mysql_connection:
-            # Optionally clean up test data
-            # cls._cleanup_test_database()
-            cls.mysql_connection.close()
+    config: DatabaseConfig = _CONFIG
     
     @classmethod
-    def _check_mysql_server_availability(cls) -> bool:
-        """Check if MySQL server is available."""
-        try:
-            # Try to connect to MySQL server (without specifying database)
-            test_connection = mysql.connector.connect(
-                host=cls.config.host,
-                user=cls.config.user,
-                password=cls.config.password
-            )
-            test_connection.close()
-            return True
-        except Error as e:
-            print(f"MySQL server not available: {e}")
-            return False
+    def setUpClass(cls) -> None:
+        """Pick up the database state prepared once for the module by setUpModule."""
+        cls.mysql_connection: MySQLConnection = _SHARED['mysql_connection']
+        cls.connection = _SHARED['connection']
+        cls.query_executor: QueryExecutor = _SHARED['query_executor']
     
     @classmethod
     def _setup_test_database(cls) -> None:
-        """Create test database and tables with sample data."""
+        """
+        Create test database and tables with sample data.
+        
+        Raises:
+            Error: If the server is unreachable or the fixture cannot be loaded
+        """
+        global _SCHEMA_READY
+        if _SCHEMA_READY:
+            return
+        
+        # Connect to MySQL server (returned to the pool by close(), even
+        # when a statement fails)
+        connection = _SERVER_POOL.get_connection()
         try:
-            # Connect to MySQL server
-            connection = mysql.connector.connect(
-                host=cls.config.host,
-                user=cls.config.user,
-                password=cls.config.password
-            )
             cursor = connection.cursor()
-            
-            # Create database if it doesn't exist
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {cls.config.database}")
-            cursor.execute(f"USE {cls.config.database}")
-            
-            # Create users table
-            create_users_table = """
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(100) NOT NULL,
-                email VARCHAR(100) NOT NULL UNIQUE,
-                age INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-            cursor.execute(create_users_table)
-            
-            # Create orders table
-            create_orders_table = """
-            CREATE TABLE IF NOT EXISTS orders (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                user_id INT,
-                product_name VARCHAR(100) NOT NULL,
-                quantity INT NOT NULL,
-                price DECIMAL(10, 2) NOT NULL,
-                order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-            """
-            cursor.execute(create_orders_table)
-            
-            # Clear existing test data
-            cursor.execute("DELETE FROM orders")
-            cursor.execute("DELETE FROM users")
-            cursor.execute("ALTER TABLE users AUTO_INCREMENT = 1")
-            cursor.execute("ALTER TABLE orders AUTO_INCREMENT = 1")
-            
-            # Insert sample users
-            insert_users = """
-            INSERT INTO users (name, email, age) VALUES
-            ('John Doe', 'john.doe@example.com', 30),
-            ('Jane Smith', 'jane.smith@example.com', 25),
-            ('Bob Johnson', 'bob.johnson@example.com', 35),
-            ('Alice Brown', 'alice.brown@example.com', 28),
-            ('Charlie Wilson', 'charlie.wilson@example.com', 32)
-            """
-            cursor.execute(insert_users)
-            
-            # Insert sample orders
-            insert_orders = """
-            INSERT INTO orders (user_id, product_name, quantity, price) VALUES
-            (1, 'Laptop', 1, 999.99),
-            (1, 'Mouse', 2, 25.50),
-            (2, 'Keyboard', 1, 75.00),
-            (2, 'Monitor', 1, 299.99),
-            (3, 'Tablet', 1, 499.99),
-            (4, 'Headphones', 1, 199.99),
-            (4, 'Webcam', 1, 89.99),
-            (5, 'Smartphone', 1, 699.99)
-            """
-            cursor.execute(insert_orders)
-            
-            connection.commit()
-            cursor.close()
+            try:
+                # Create the database and both tables in one round trip, dropping
+                # any setup procedure left by an older fixture. Parallel workers
+                # (pytest -n auto) each run this setup; the named lock serializes
+                # them until the fixture is in place
+                schema_script = f"""
+                CREATE DATABASE IF NOT EXISTS {cls.config.database};
+                USE {cls.config.database};
+                DO GET_LOCK('upe_realdb_fixture', 30);
+                CREATE TABLE IF NOT EXISTS users (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL,
+                    email VARCHAR(100) NOT NULL UNIQUE,
+                    age INT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE TABLE IF NOT EXISTS orders (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    user_id INT,
+                    product_name VARCHAR(100) NOT NULL,
+                    quantity INT NOT NULL,
+                    price DECIMAL(10, 2) NOT NULL,
+                    order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                );
+                DROP PROCEDURE IF EXISTS setup_testdb
+                """
+                cls._run_script(cursor, schema_script)
+                
+                # Reset and repopulate server-side in a single CALL
+                cls._install_setup_procedure(cursor)
+                cursor.callproc('setup_testdb')
+            finally:
+                # Releasing a lock this session does not hold is a no-op
+                try:
+                    cursor.execute("DO RELEASE_LOCK('upe_realdb_fixture')")
+                finally:
+                    cursor.close()
+        finally:
             connection.close()
-            
-            print("✓ Test database and sample data created successfully")
-            
-        except Error as e:
-            raise unittest.SkipTest(f"Could not set up test database: {e}")
+        _SCHEMA_READY = True
+        
+        print("✓ Test database and sample data created successfully")
+    
+    @staticmethod
+    def _run_script(cursor: Any, script: str) -> None:
+        """
+        Send several ;-separated statements to the server in one round trip.
+        
+        mysql-connector before 9.2 needs multi=True and returns an iterator
+        of results; later releases dropped the flag and run multi-statement
+        strings directly, walking the results with fetchsets().
+        
+        Args:
+            cursor: Cursor on the server connection
+            script: Statements separated by semicolons
+        """
+        try:
+            results = cursor.execute(script, multi=True)
+        except TypeError:
+            cursor.execute(script)
+            for _ in cursor.fetchsets():
+                pass
+            return
+        for result in results:
+            if result.with_rows:
+                result.fetchall()
+    
+    @staticmethod
+    def _install_setup_procedure(cursor: Any) -> None:
+        """
+        Create the setup_testdb() procedure that resets and repopulates the fixture.
+        
+        A worker that finds the fixture already loaded leaves it alone rather
+        than truncating under other workers' readers. TRUNCATE also resets
+        AUTO_INCREMENT, and orders' FK on users only lets it through with
+        checks off. LOAD DATA is not allowed in stored programs, so the rows
+        go in as one multi-row INSERT per table, with the values escaped
+        client-side by the parameter substitution.
+        
+        Args:
+            cursor: Cursor on the test database
+        """
+        users_values: str = ', '.join(['(%s, %s, %s)'] * len(_USERS))
+        orders_values: str = ', '.join(['(%s, %s, %s, %s)'] * len(_ORDERS))
+        cursor.execute(
+            f"""
+            CREATE PROCEDURE setup_testdb()
+            BEGIN
+                DECLARE EXIT HANDLER FOR SQLEXCEPTION
+                BEGIN
+                    ROLLBACK;
+                    SET foreign_key_checks = 1, unique_checks = 1;
+                    RESIGNAL;
+                END;
+                IF (SELECT COUNT(*) FROM users) <> {len(_USERS)}
+                        OR (SELECT COUNT(*) FROM orders) <> {len(_ORDERS)} THEN
+                    SET foreign_key_checks = 0, unique_checks = 0;
+                    TRUNCATE TABLE orders;
+                    TRUNCATE TABLE users;
+                    START TRANSACTION;
+                    INSERT INTO users (name, email, age) VALUES {users_values};
+                    INSERT INTO orders (user_id, product_name, quantity, price) VALUES {orders_values};
+                    COMMIT;
+                    SET foreign_key_checks = 1, unique_checks = 1;
+                END IF;
+            END
+            """,
+            [value for row in _USERS + _ORDERS for value in row]
+        )
     
     @classmethod
     def _cleanup_test_database(cls) -> None:
-        """Clean up test database (optional)."""
+        """Clean up test database (optional; needs the pool setUpModule opens)."""
         try:
-            connection = mysql.connector.connect(
-                host=cls.config.host,
-                user=cls.config.user,
-                password=cls.config.password
-            )
+            connection = _SERVER_POOL.get_connection()
             cursor = connection.cursor()
             
             # Optionally drop the test database
@@ -167,11 +345,6 @@ class TestQueryExecutorRealDB(unittest.TestCase):
         except Error as e:
             print(f"Warning: Could not clean up test database: {e}")
     
-    def setUp(self) -> None:
-        """Set up for each test method."""
-        if not self.db_available:
-            self.skipTest("Database not available")
-    
     def test_execute_simple_select_query(self) -> None:
         """Test executing a simple SELECT query."""
         query: str = "SELECT id, name, email FROM users ORDER BY id LIMIT 2"
@@ -208,12 +381,7 @@ class TestQueryExecutorRealDB(unittest.TestCase):
     
     def test_execute_join_query(self) -> None:
         """Test executing a JOIN query."""
-        query: str = """
-        SELECT u.name, u.email, o.product_name, o.quantity, o.price
-        FROM users u
-        JOIN orders o ON u.id = o.user_id
-        ORDER BY u.name, o.product_name
-        """
+        query: str = _JOIN_QUERY
         
         results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
         
@@ -234,10 +402,7 @@ class TestQueryExecutorRealDB(unittest.TestCase):
     
     def test_execute_aggregate_query(self) -> None:
         """Test executing an aggregate query."""
-        query: str = """
-        SELECT COUNT(*) as user_count, AVG(age) as avg_age, MIN(age) as min_age, MAX(age) as max_age
-        FROM users
-        """
+        query: str = _AGGREGATE_QUERY
         
         results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
         
@@ -258,7 +423,8 @@ class TestQueryExecutorRealDB(unittest.TestCase):
         """Test executing a query that returns no results."""
         query: str = "SELECT * FROM users WHERE age > 100"
         
-        results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
+        # Only the row count is checked, so skip building dictionaries
+        results: List[Tuple[Any, ...]] = self.query_executor.execute_query(query, tuple_mode=True)
         
         self.assertIsInstance(results, list)
         self.assertEqual(len(results), 0)
@@ -272,20 +438,8 @@ class TestQueryExecutorRealDB(unittest.TestCase):
     
     def test_execute_query_with_special_characters(self) -> None:
         """Test executing a query with special characters in data."""
-        # First, insert a test record with special characters
-        setup_query: str = """
-        INSERT IGNORE INTO users (name, email, age) 
-        VALUES ('Test User & Co.', 'test+special@example.com', 30)
-        """
-        
+        # The 'Test User & Co.' row is part of the class fixture
         try:
-            # Setup test data
-            cursor = self.connection.cursor()
-            cursor.execute(setup_query)
-            self.connection.commit()
-            cursor.close()
-            
-            # Test the query
             query: str = "SELECT name, email FROM users WHERE name LIKE '%&%'"
             results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
             
@@ -298,20 +452,8 @@ class TestQueryExecutorRealDB(unittest.TestCase):
     
     def test_execute_query_with_null_values(self) -> None:
         """Test executing a query that may return NULL values."""
-        # Insert a user with a NULL age
-        setup_query: str = """
-        INSERT IGNORE INTO users (name, email, age) 
-        VALUES ('Test User NULL', 'test_null@example.com', NULL)
-        """
-        
+        # The 'Test User NULL' row (age NULL) is part of the class fixture
         try:
-            # Setup test data
-            cursor = self.connection.cursor()
-            cursor.execute(setup_query)
-            self.connection.commit()
-            cursor.close()
-            
-            # Test the query
             query: str = "SELECT name, email, age FROM users WHERE name = 'Test User NULL'"
             results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
             
@@ -326,28 +468,23 @@ class TestQueryExecutorRealDB(unittest.TestCase):
         """Test executing a query with ORDER BY clause."""
         query: str = "SELECT name, age FROM users ORDER BY age DESC"
         
-        results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
-        
-        self.assertIsInstance(results, list)
-        self.assertGreater(len(results), 0)
+        # Stream the rows in fetch_size batches rather than materializing the list
+        row_count: int = 0
         
         # Verify ordering (should be descending by age)
         previous_age: Optional[int] = None
-        for row in results:
+        for row in self.query_executor.iter_query(query):
             current_age: Optional[int] = row['age']
             if previous_age is not None and current_age is not None:
                 self.assertGreaterEqual(previous_age, current_age)
             previous_age = current_age
+            row_count += 1
+        
+        self.assertGreater(row_count, 0)
     
     def test_execute_group_by_query(self) -> None:
         """Test executing a query with GROUP BY clause."""
-        query: str = """
-        SELECT u.name, COUNT(o.id) as order_count, SUM(o.price) as total_spent
-        FROM users u
-        LEFT JOIN orders o ON u.id = o.user_id
-        GROUP BY u.id, u.name
-        ORDER BY u.name
-        """
+        query: str = _GROUP_BY_QUERY
         
         results: List[Dict[str, Any]] = self.query_executor.execute_query(query)
         
@@ -382,6 +519,29 @@ class TestQueryExecutorRealDB(unittest.TestCase):
         self.assertEqual(row['id'], 2)
         self.assertIsInstance(row['name'], str)
         self.assertIsInstance(row['email'], str)
+    
+    def test_independent_queries_on_pool_run_concurrently(self) -> None:
+        """Test that independent queries overlap their round trips on a pooled executor."""
+        queries: List[str] = [
+            "SELECT COUNT(*) AS count FROM users",
+            "SELECT COUNT(*) AS count FROM orders",
+            "SELECT user_id, SUM(quantity) AS total FROM orders GROUP BY user_id ORDER BY user_id",
+        ]
+        # Unique per run, so re-running the test in one process never reuses a pool name
+        pool: pooling.MySQLConnectionPool = self.mysql_connection.create_pool(
+            pool_size=len(queries), pool_name=f"testpool_concurrent_{id(self)}"
+        )
+        # The pool has no public close; _remove_connections() closes the idle
+        # connections, which is all of them once the workers are done
+        self.addCleanup(pool._remove_connections)
+        pooled_executor: QueryExecutor = QueryExecutor(pool)
+        self.addCleanup(pooled_executor.close)
+        
+        # Each worker checks out its own pooled connection for the query
+        with ThreadPoolExecutor(max_workers=len(queries)) as workers:
+            results: List[List[Dict[str, Any]]] = list(workers.map(pooled_executor.execute_query, queries))
+        
+        self.assertEqual(results, [self.query_executor.execute_query(query) for query in queries])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+import unittest
+import dataclasses
+
+from config.sqlserver_config import SQLServerConfig
+
+
+class TestSQLServerConfig(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test fixtures before each test method."""
+        self.config: SQLServerConfig = SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret"
+        )
+
+    def test_config_is_immutable(self) -> None:
+        """Test that fields cannot be reassigned after construction."""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.config.host = "otherhost"  # type: ignore[misc]
+
+    def test_replace_creates_modified_copy(self) -> None:
+        """Test dataclasses.replace as the way to derive a modified config."""
+        updated: SQLServerConfig = dataclasses.replace(self.config, encrypt="yes")
+
+        self.assertEqual(updated.encrypt, "yes")
+        self.assertEqual(self.config.encrypt, "no")
+        self.assertEqual(updated.host, self.config.host)
+
+    def test_config_has_no_instance_dict(self) -> None:
+        """Test that slots are used instead of a per-instance __dict__."""
+        self.assertFalse(hasattr(self.config, '__dict__'))
+
+    def test_all_failed_checks_reported_together(self) -> None:
+        """Test that construction reports every failed check in one ValueError."""
+        with self.assertRaises(ValueError) as ctx:
+            dataclasses.replace(self.config, host=" ", port=0)
+
+        self.assertEqual(str(ctx.exception), "Host cannot be empty; Invalid port number: 0")
+
+    def test_positional_arguments_rejected(self) -> None:
+        """Test that the constructor only accepts keyword arguments."""
+        with self.assertRaises(TypeError):
+            SQLServerConfig("localhost", "testdb", "sa", "secret")  # type: ignore[misc]
+
+    def test_invalid_yes_no_flag_raises(self) -> None:
+        """Test that yes/no flags reject other values."""
+        with self.assertRaises(ValueError):
+            dataclasses.replace(self.config, mars="maybe")
+
+    def test_yes_no_flags_are_lowercased(self) -> None:
+        """Test that yes/no flags are stored in canonical lowercase form."""
+        config: SQLServerConfig = dataclasses.replace(self.config, encrypt="YES", mars="No")
+
+        self.assertEqual(config.encrypt, "yes")
+        self.assertEqual(config.mars, "no")
+        self.assertEqual(config.validate(), [])
+
+    def test_packet_size_range(self) -> None:
+        """Test that packet_size accepts 0 or 512-32767 and rejects everything else."""
+        for size in (0, 512, 16383, 32767):
+            with self.subTest(size=size):
+                self.assertEqual(dataclasses.replace(self.config, packet_size=size).packet_size, size)
+        for size in (-1, 1, 511, 32768):
+            with self.subTest(size=size):
+                with self.assertRaises(ValueError) as ctx:
+                    dataclasses.replace(self.config, packet_size=size)
+                self.assertEqual(str(ctx.exception), f"Invalid network packet size: {size}")
+
+    def test_validate_valid_config(self) -> None:
+        """Test validate() reports no issues for a valid config."""
+        self.assertEqual(self.config.validate(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,403 @@
+import unittest
+import dataclasses
+import os
+from unittest import skipIf
+from unittest.mock import Mock, patch
+
+from config.sqlserver_config import SQLServerConfig
+
+# pyodbc needs the unixODBC driver manager at import time
+try:
+    import pyodbc
+    from src.database.sqlserver_connection import (
+        _ERROR_CLASS_RE,
+        _SQL_ATTR_PACKET_SIZE,
+        _VALIDATE_CACHE,
+        SQLServerConnection,
+        close_pooled_connections,
+    )
+except ImportError:
+    SQLServerConnection = None
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestSQLServerConnection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up a connection manager whose raw pyodbc connection is a mock."""
+        self.config: SQLServerConfig = SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret",
+            arraysize=250
+        )
+        self.raw_connection: Mock = Mock()
+        self.raw_connection.cursor.side_effect = self._new_cursor
+        patcher = patch.object(SQLServerConnection, '_raw_connection', return_value=self.raw_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sql_conn: SQLServerConnection = SQLServerConnection(self.config)
+
+    @staticmethod
+    def _new_cursor() -> Mock:
+        """Return a cursor mock whose execute() returns the cursor, as pyodbc's does."""
+        cursor: Mock = Mock()
+        cursor.execute.return_value = cursor
+        return cursor
+
+    def test_cursor_from_connect_uses_config_arraysize(self) -> None:
+        """Test that cursors opened on the connection returned by connect() carry config.arraysize."""
+        cursor = self.sql_conn.connect().cursor()
+
+        self.assertEqual(cursor.arraysize, self.config.arraysize)
+
+    def test_execute_from_connect_uses_config_arraysize(self) -> None:
+        """Test that Connection.execute() shortcuts also run on a sized cursor."""
+        cursor = self.sql_conn.connect().execute("SELECT 1")
+
+        self.assertEqual(cursor.arraysize, self.config.arraysize)
+        cursor.execute.assert_called_once_with("SELECT 1")
+
+    def test_connect_delegates_to_raw_connection(self) -> None:
+        """Test that other attributes read and write through to the pyodbc connection."""
+        connection = self.sql_conn.connect()
+        connection.autocommit = True
+        connection.commit()
+
+        self.assertIs(self.sql_conn.connect(), connection)
+        self.assertTrue(self.raw_connection.autocommit)
+        self.raw_connection.commit.assert_called_once_with()
+
+    def test_default_arraysize_from_config(self) -> None:
+        """Test that the default config arraysize reaches the cursor."""
+        sql_conn: SQLServerConnection = SQLServerConnection(dataclasses.replace(self.config, arraysize=1000))
+
+        self.assertEqual(sql_conn.cursor().arraysize, 1000)
+
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestIsConnected(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up a connection manager holding a mock pyodbc connection."""
+        self.sql_conn: SQLServerConnection = SQLServerConnection(SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret"
+        ))
+        self.raw_connection: Mock = Mock(closed=False)
+        self.sql_conn._connection = self.raw_connection
+        clock_patcher = patch('src.database.sqlserver_connection.time.monotonic', return_value=100.0)
+        self.mock_clock: Mock = clock_patcher.start()
+        self.addCleanup(clock_patcher.stop)
+
+    def test_shallow_check_makes_no_round_trip(self) -> None:
+        """Test that is_connected() without deep only inspects local state."""
+        self.assertTrue(self.sql_conn.is_connected())
+        self.raw_connection.cursor.assert_not_called()
+
+        self.raw_connection.closed = True
+        self.assertFalse(self.sql_conn.is_connected())
+
+    def test_deep_probe_reused_within_ttl(self) -> None:
+        """Test that a deep probe result is trusted for the TTL, then the server is probed again."""
+        probe_cursor: Mock = self.raw_connection.cursor.return_value
+
+        self.assertTrue(self.sql_conn.is_connected(deep=True))
+        self.mock_clock.return_value = 104.0
+        self.assertTrue(self.sql_conn.is_connected(deep=True))
+        probe_cursor.execute.assert_called_once_with("SELECT 1")
+
+        self.mock_clock.return_value = 106.0
+        self.assertTrue(self.sql_conn.is_connected(deep=True))
+        self.assertEqual(probe_cursor.execute.call_count, 2)
+        self.raw_connection.cursor.assert_called_once_with()
+
+    def test_failed_probe_drops_probe_cursor(self) -> None:
+        """Test that a failing probe reports False and the next probe opens a fresh cursor."""
+        self.raw_connection.cursor.return_value.execute.side_effect = pyodbc.Error("08S01", "link failure")
+
+        self.assertFalse(self.sql_conn.is_connected(deep=True))
+        self.assertIsNone(self.sql_conn._probe_cursor)
+
+        self.raw_connection.cursor.return_value.execute.side_effect = None
+        self.mock_clock.return_value = 110.0
+        self.assertTrue(self.sql_conn.is_connected(deep=True))
+        self.assertEqual(self.raw_connection.cursor.call_count, 2)
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestOpenConnection(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up the config the pre-connect attributes come from."""
+        self.config: SQLServerConfig = SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret"
+        )
+
+    @patch('src.database.sqlserver_connection.pyodbc.connect')
+    def test_packet_size_set_before_login(self, mock_connect: Mock) -> None:
+        """Test that config.packet_size goes to pyodbc as attrs_before SQL_ATTR_PACKET_SIZE (112)."""
+        SQLServerConnection(self.config)._open_connection("DSN=test")
+
+        self.assertEqual(_SQL_ATTR_PACKET_SIZE, 112)
+        mock_connect.assert_called_once_with("DSN=test", attrs_before={112: self.config.packet_size})
+
+    @patch('src.database.sqlserver_connection.pyodbc.connect')
+    def test_packet_size_zero_keeps_driver_default(self, mock_connect: Mock) -> None:
+        """Test that packet_size=0 passes no pre-connect attributes."""
+        SQLServerConnection(dataclasses.replace(self.config, packet_size=0))._open_connection("DSN=test")
+
+        mock_connect.assert_called_once_with("DSN=test")
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestErrorClassification(unittest.TestCase):
+
+    def test_error_classes_keep_priority_order(self) -> None:
+        """Test that the first matching class wins wherever its keywords appear in the message."""
+        cases = (
+            ("[08001] TCP Provider: Error code 0x2746 (10054)", "tcp"),
+            ("SSL error after TCP Provider reported 10061; login failed", "tcp"),
+            ("Cannot open database \"x\". Login failed for user 'sa'.", "login"),
+            ("Certificate chain untrusted; cannot open database \"x\"", "database"),
+            ("SSL Provider: certificate verify failed", "ssl"),
+            ("TCP Provider: timeout (258) over SSL", "ssl"),
+        )
+        for message, expected in cases:
+            with self.subTest(message=message):
+                self.assertEqual(_ERROR_CLASS_RE.match(message).lastgroup, expected)
+
+        self.assertIsNone(_ERROR_CLASS_RE.match("Invalid object name 'users'"))
+
+    def test_error_message_lists_suggestions_for_class(self) -> None:
+        """Test that the built message carries the matched class's suggestions with the host."""
+        sql_conn: SQLServerConnection = SQLServerConnection(SQLServerConfig(
+            host="db.example.com",
+            database="testdb",
+            user="sa",
+            password="secret"
+        ))
+
+        message: str = sql_conn._build_error_message(pyodbc.Error("28000", "Login failed for user 'sa'"))
+
+        self.assertIn("Verify username and password are correct", message)
+        self.assertNotIn("nc -zv", message)
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestSQLServerConnectionPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Patch pyodbc.connect and the clock so pooling runs without a server."""
+        self.config: SQLServerConfig = SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret",
+            pool_max_size=2
+        )
+        connect_patcher = patch(
+            'src.database.sqlserver_connection.pyodbc.connect', side_effect=lambda *args, **kwargs: Mock()
+        )
+        self.mock_connect: Mock = connect_patcher.start()
+        self.addCleanup(connect_patcher.stop)
+        conn_str_patcher = patch.object(
+            SQLServerConnection, '_build_connection_string', return_value="DSN=test"
+        )
+        conn_str_patcher.start()
+        self.addCleanup(conn_str_patcher.stop)
+        clock_patcher = patch('src.database.sqlserver_connection.time.monotonic', return_value=0.0)
+        self.mock_clock: Mock = clock_patcher.start()
+        self.addCleanup(clock_patcher.stop)
+        self.addCleanup(close_pooled_connections)
+
+    def _opened(self, config: SQLServerConfig) -> 'SQLServerConnection':
+        """Return a connection manager that has connected."""
+        sql_conn: SQLServerConnection = SQLServerConnection(config)
+        sql_conn.connect()
+        return sql_conn
+
+    def test_pooling_disabled_by_default(self) -> None:
+        """Test that without pool_max_size, close() closes the connection instead of pooling it."""
+        sql_conn = self._opened(dataclasses.replace(self.config, pool_max_size=0))
+        raw = sql_conn.connect().raw
+        sql_conn.close()
+
+        raw.close.assert_called_once_with()
+        self.assertIsNot(self._opened(self.config).connect().raw, raw)
+
+    def test_release_and_acquire_reuses_connection(self) -> None:
+        """Test that a released connection is rolled back and handed to the next connect()."""
+        sql_conn = self._opened(self.config)
+        raw = sql_conn.connect().raw
+        sql_conn.close()
+
+        raw.rollback.assert_called_once_with()
+        raw.close.assert_not_called()
+        self.assertIs(self._opened(self.config).connect().raw, raw)
+        self.mock_connect.assert_called_once()
+
+    def test_idle_connection_probed_before_reuse(self) -> None:
+        """Test that a long-idle connection failing SELECT 1 is closed and replaced."""
+        sql_conn = self._opened(self.config)
+        stale = sql_conn.connect().raw
+        stale.cursor.return_value.execute.side_effect = pyodbc.Error("08S01", "link failure")
+        sql_conn.close()
+
+        self.mock_clock.return_value = 60.0
+        fresh = self._opened(self.config).connect().raw
+
+        stale.close.assert_called_once_with()
+        self.assertIsNot(fresh, stale)
+        self.assertEqual(self.mock_connect.call_count, 2)
+
+    def test_recently_released_connection_not_probed(self) -> None:
+        """Test that a connection idle for less than the validation TTL is reused without a probe."""
+        sql_conn = self._opened(self.config)
+        raw = sql_conn.connect().raw
+        sql_conn.close()
+
+        self.mock_clock.return_value = 1.0
+        self.assertIs(self._opened(self.config).connect().raw, raw)
+        raw.cursor.assert_not_called()
+
+    def test_overflow_beyond_pool_size_is_closed(self) -> None:
+        """Test that releases beyond each config's pool_max_size close the connection."""
+        managers = [self._opened(self.config) for _ in range(3)]
+        raws = [manager.connect().raw for manager in managers]
+        for manager in managers:
+            manager.close()
+
+        raws[0].close.assert_not_called()
+        raws[1].close.assert_not_called()
+        raws[2].close.assert_called_once_with()
+
+        # A larger pool for the same connection string is not capped by the first config
+        larger_config: SQLServerConfig = dataclasses.replace(self.config, pool_max_size=3)
+        larger = [self._opened(larger_config) for _ in range(3)]
+        larger_raws = [manager.connect().raw for manager in larger]
+        for manager in larger:
+            manager.close()
+
+        for raw in larger_raws:
+            raw.close.assert_not_called()
+
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestValidateConnectionPrerequisites(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Patch driver detection and the clock so results are cached deterministically."""
+        self.sql_conn: SQLServerConnection = SQLServerConnection(SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret"
+        ))
+        drivers_patcher = patch.object(
+            SQLServerConnection, '_detect_odbc_drivers', return_value=["ODBC Driver 18 for SQL Server"]
+        )
+        self.mock_drivers: Mock = drivers_patcher.start()
+        self.addCleanup(drivers_patcher.stop)
+        clock_patcher = patch('src.database.sqlserver_connection.time.monotonic', return_value=0.0)
+        self.mock_clock: Mock = clock_patcher.start()
+        self.addCleanup(clock_patcher.stop)
+        _VALIDATE_CACHE.clear()
+        self.addCleanup(_VALIDATE_CACHE.clear)
+
+    def test_cache_hit_returns_independent_copy(self) -> None:
+        """Test that a cached result is reused without re-checking and is safe to mutate."""
+        first = self.sql_conn.validate_connection_prerequisites()
+        first['config_issues'].append("caller note")
+        first['config_valid'] = False
+
+        self.mock_clock.return_value = 30.0
+        second = self.sql_conn.validate_connection_prerequisites()
+
+        self.assertEqual(second['config_issues'], [])
+        self.assertTrue(second['config_valid'])
+        self.assertIsNot(second['odbc_drivers_available'], first['odbc_drivers_available'])
+        self.mock_drivers.assert_called_once()
+
+    def test_cache_expires_after_ttl(self) -> None:
+        """Test that the checks run again once the cached result is older than the TTL."""
+        self.sql_conn.validate_connection_prerequisites()
+
+        self.mock_clock.return_value = 61.0
+        self.mock_drivers.return_value = []
+        result = self.sql_conn.validate_connection_prerequisites()
+
+        self.assertEqual(self.mock_drivers.call_count, 2)
+        self.assertFalse(result['config_valid'])
+        self.assertIn("No SQL Server ODBC drivers found", result['config_issues'])
+
+
+
+@skipIf(SQLServerConnection is None, "pyodbc or the ODBC driver manager is not installed")
+class TestOpenSSLLegacyPatch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Make every first connection attempt fail with the macOS TLS error."""
+        self.config: SQLServerConfig = SQLServerConfig(
+            host="localhost",
+            database="testdb",
+            user="sa",
+            password="secret"
+        )
+        env_patcher = patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        os.environ.pop('OPENSSL_CONF', None)
+        for patcher in (
+            patch('src.database.sqlserver_connection.sys.platform', 'darwin'),
+            patch('src.database.sqlserver_connection.pyodbc.connect', side_effect=self._connect),
+            patch.object(SQLServerConnection, '_build_connection_string', return_value="DSN=test"),
+            patch('builtins.print'),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.attempts: int = 0
+
+    def _connect(self, *args: object, **kwargs: object) -> Mock:
+        """Fail until OPENSSL_CONF points at the legacy config, like a legacy-TLS server."""
+        self.attempts += 1
+        if 'OPENSSL_CONF' not in os.environ:
+            raise pyodbc.Error("08001", "[08001] TCP Provider: Error code 0x2746 (10054)")
+        return Mock()
+
+    def test_close_restores_openssl_conf(self) -> None:
+        """Test that OPENSSL_CONF is unset again once the patched connection is closed."""
+        sql_conn: SQLServerConnection = SQLServerConnection(self.config)
+        sql_conn.connect()
+        self.assertIn('OPENSSL_CONF', os.environ)
+
+        sql_conn.close()
+
+        self.assertNotIn('OPENSSL_CONF', os.environ)
+        self.assertEqual(self.attempts, 2)
+
+    def test_openssl_conf_kept_until_last_patched_connection_closes(self) -> None:
+        """Test that OPENSSL_CONF stays set while another patched connection is open."""
+        first: SQLServerConnection = SQLServerConnection(self.config)
+        first.connect()
+        second: SQLServerConnection = SQLServerConnection(self.config)
+        second.connect()
+        patch_path: str = os.environ['OPENSSL_CONF']
+
+        first.close()
+        self.assertEqual(os.environ.get('OPENSSL_CONF'), patch_path)
+
+        second.close()
+        self.assertNotIn('OPENSSL_CONF', os.environ)
+
+
+if __name__ == '__main__':
+    unittest.main()